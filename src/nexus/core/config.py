@@ -1,12 +1,22 @@
 """Configuration management module."""
 
 import json
-import yaml
+from contextlib import contextmanager
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
-from rich.console import Console
+from typing import Dict, Any, Iterator, Optional
+from .fileutil import write_atomic
 
-console = Console()
+
+@lru_cache(maxsize=1)
+def _console():
+    """Create the rich console on first use."""
+    from rich.console import Console
+    return Console()
+
+
+# Marker for keys absent from the configuration in the get() cache
+_MISSING = object()
 
 # Import hybrid config for enhanced functionality
 try:
@@ -28,22 +38,22 @@ class ConfigManager:
         self.project_root = project_root or Path.cwd()
         self.nexus_dir = self.project_root / ".nexus"
         self.config_file = self.nexus_dir / "config.json"
-        self._config = None
+        self._get_cache: Dict[str, Any] = {}
+        self._batch_depth = 0
+        self._dirty = False
         self.use_hybrid = use_hybrid and HYBRID_AVAILABLE
         
         # Initialize hybrid config manager if available
         if self.use_hybrid:
             self._hybrid_manager = HybridConfigManager(self.project_root)
     
-    @property
+    @cached_property
     def config(self) -> Dict[str, Any]:
-        """Get current configuration."""
+        """Get current configuration (loaded once, replaced by save_config)."""
         if self.use_hybrid:
             return self._hybrid_manager.config
         
-        if self._config is None:
-            self._config = self.load_config()
-        return self._config
+        return self.load_config()
     
     def load_config(self) -> Dict[str, Any]:
         """Load configuration from file.
@@ -55,10 +65,9 @@ class ConfigManager:
             return self._get_default_config()
         
         try:
-            with open(self.config_file, 'r') as f:
-                return json.load(f)
+            return json.loads(self.config_file.read_bytes())
         except (json.JSONDecodeError, IOError) as e:
-            console.print(f"⚠️  Error loading config: {e}", style="yellow")
+            _console().print(f"⚠️  Error loading config: {e}", style="yellow")
             return self._get_default_config()
     
     def save_config(self, config: Optional[Dict[str, Any]] = None) -> None:
@@ -68,16 +77,50 @@ class ConfigManager:
             config: Configuration to save (uses current config if None)
         """
         if config is not None:
-            self._config = config
+            self.__dict__["config"] = config
+        self._get_cache.clear()
+        
+        # Defer the write until the enclosing batch() exits
+        if self._batch_depth:
+            self._dirty = True
+            return
+        
+        self._write_config()
+    
+    def flush(self) -> None:
+        """Write configuration changes deferred by batch() to file."""
+        if self._dirty:
+            self._write_config()
+    
+    @contextmanager
+    def batch(self) -> Iterator["ConfigManager"]:
+        """Group several set()/update_config() calls into a single write.
+        
+        Yields:
+            This configuration manager
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.flush()
+    
+    def _write_config(self) -> None:
+        """Atomically write the current configuration to file."""
+        self._dirty = False
         
         # Ensure nexus directory exists
         self.nexus_dir.mkdir(parents=True, exist_ok=True)
         
+        # Serialize first: a value json cannot encode raises before any file
+        # is touched, and write_atomic removes its temp file on failure
+        content = json.dumps(self.config, indent=2)
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self._config, f, indent=2)
+            write_atomic(self.config_file, content)
         except IOError as e:
-            console.print(f"❌ Error saving config: {e}", style="red")
+            _console().print(f"❌ Error saving config: {e}", style="red")
     
     def update_config(self, updates: Dict[str, Any]) -> None:
         """Update configuration with new values.
@@ -99,16 +142,19 @@ class ConfigManager:
         Returns:
             Configuration value
         """
-        keys = key.split('.')
-        value = self.config
-        
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
+        try:
+            value = self._get_cache[key]
+        except KeyError:
+            value = self.config
+            for k in key.split('.'):
+                if isinstance(value, dict) and k in value:
+                    value = value[k]
+                else:
+                    value = _MISSING
+                    break
+            self._get_cache[key] = value
         
-        return value
+        return default if value is _MISSING else value
     
     def set(self, key: str, value: Any) -> None:
         """Set configuration value by key.
@@ -176,11 +222,19 @@ class ConfigManager:
             base_dict: Base dictionary to update
             update_dict: Dictionary with updates
         """
-        for key, value in update_dict.items():
-            if key in base_dict and isinstance(base_dict[key], dict) and isinstance(value, dict):
-                self._deep_update(base_dict[key], value)
-            else:
-                base_dict[key] = value
+        # Walk dict-dict overlaps with an explicit stack, mutating in place.
+        # Config data is plain JSON dicts, so exact type checks suffice and
+        # leaf values are assigned without looking up the base side.
+        stack = [(base_dict, update_dict)]
+        while stack:
+            base, update = stack.pop()
+            for key, value in update.items():
+                if type(value) is dict:
+                    current = base.get(key)
+                    if type(current) is dict:
+                        stack.append((current, value))
+                        continue
+                base[key] = value
     
     def is_initialized(self) -> bool:
         """Check if Nexus is initialized in this project.
@@ -2,7 +2,221 @@
 Discovery Synthesizer - Turns raw analysis into insights and recommendations.
 """
 
-from typing import Dict, List, Optional, Any
+import sys
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+
+# Framework categories used for project type detection
+_WEB_BACKEND_FRAMEWORKS = frozenset({'django', 'flask', 'fastapi', 'express', 'koa'})
+_WEB_FRONTEND_FRAMEWORKS = frozenset({'react', 'vue', 'angular', 'nextjs', 'nuxt'})
+_DATA_SCIENCE_FRAMEWORKS = frozenset({'pandas', 'numpy', 'scikit-learn', 'tensorflow', 'pytorch', 'jupyter'})
+_CLI_FRAMEWORKS = frozenset({'click', 'argparse', 'typer'})
+_MOBILE_FRAMEWORKS = frozenset({'react-native', 'flutter', 'xamarin'})
+
+# Any backend or frontend web framework makes a project a web application
+_WEB_FRAMEWORKS = _WEB_BACKEND_FRAMEWORKS | _WEB_FRONTEND_FRAMEWORKS
+
+# Project-type specific quality bonuses: (pattern, points) pairs and
+# (frameworks, points) pairs that score when any listed framework is used
+_TYPE_PATTERN_BONUSES: Dict[str, Tuple[Tuple[str, int], ...]] = {
+    'cli_application': (
+        ('cli_application', 10),
+        ('rich_output', 5),
+        ('plugin_architecture', 8),
+        ('template_system', 3),
+        ('hybrid_configuration', 3),
+        ('cross_platform', 3),
+    ),
+    'web_application': (('api_service', 5), ('mvc', 5)),
+    'data_science': (('notebooks', 3),),
+    # Extra bonuses for documented, tested and versioned libraries
+    'library': (('documented', 5), ('has_tests', 5), ('versioned', 3)),
+}
+_TYPE_FRAMEWORK_BONUSES: Dict[str, Tuple[Tuple[FrozenSet[str], int], ...]] = {
+    'web_application': (
+        (frozenset({'django', 'flask', 'fastapi'}), 8),
+        (frozenset({'react', 'vue', 'angular'}), 8),
+    ),
+    'data_science': (
+        (frozenset({'pandas', 'numpy', 'scikit-learn'}), 8),
+        (frozenset({'jupyter'}), 5),
+    ),
+}
+_ORGANIZATION_PATTERNS = frozenset({'mvc', 'api_service', 'microservices'})
+
+# Frameworks whose web insight takes precedence over the Next.js one
+_NEXTJS_SHADOWING_FRAMEWORKS = frozenset({'django', 'fastapi'})
+
+# Frameworks whose projects get a containerization recommendation
+_CONTAINER_CANDIDATE_FRAMEWORKS = frozenset({'django', 'fastapi', 'express', 'nextjs'})
+
+
+class _AnalysisContext(NamedTuple):
+    """Analysis values shared by the synthesis helpers, computed once per call."""
+    data: Dict[str, Any]
+    fw: FrozenSet[str]
+    pat: FrozenSet[str]
+    langs: Tuple[str, ...]
+    entry_points: List[str]
+    quality_metrics: Dict[str, Any]
+    python_deps: Dict[str, Any]
+    total_files: int
+    test_count: int
+    project_type: str
+
+
+# Recommendation texts, interned so repeated synthesis runs share one object
+_REC_PYTEST = sys.intern("Add pytest for Python testing")
+_REC_JS_TESTS = sys.intern("Add Jest or Vitest for JavaScript testing")
+_REC_DOCUMENTATION = sys.intern("Add documentation directory and README files")
+_REC_DOCKER = sys.intern("Consider adding Docker for containerization")
+_REC_TEST_COVERAGE = sys.intern("Large codebase without tests - prioritize test coverage")
+_REC_PYPROJECT = sys.intern("Consider migrating to pyproject.toml for modern Python packaging")
+
+# Preformatted templates for insights that embed analysis values
+_LARGE_CODEBASE_TMPL = "Large codebase with {} files - consider modularization".format
+_MULTILANG_TMPL = "Multi-language project using {}".format
+_TEST_COUNT_TMPL = "Well-tested project with {} test files".format
+
+_InsightMessage = Union[str, Callable[[_AnalysisContext], str]]
+_InsightRule = Tuple[Callable[[_AnalysisContext], bool], _InsightMessage]
+
+# Insight rule groups in output order. Each group behaves like an if/elif
+# chain: only the message of its first matching rule is emitted. Messages are
+# either literal strings or callables building the text from the context.
+_INSIGHT_RULES: Tuple[Tuple[_InsightRule, ...], ...] = (
+    # Project size insights
+    (
+        (lambda c: c.total_files > 1000,
+         lambda c: _LARGE_CODEBASE_TMPL(c.total_files)),
+        (lambda c: c.total_files < 10,
+         "Small project - good for rapid development"),
+    ),
+    # Language diversity
+    (
+        (lambda c: len(c.langs) > 3,
+         lambda c: _MULTILANG_TMPL(", ".join(c.langs))),
+        (lambda c: 'python' in c.langs and 'javascript' in c.langs,
+         "Full-stack project with Python backend and JavaScript frontend"),
+    ),
+    # CLI application insights
+    (
+        (lambda c: c.project_type == 'cli_application' and 'click' in c.fw and 'rich' in c.fw,
+         "Professional CLI development framework with Click and Rich console interface"),
+        (lambda c: c.project_type == 'cli_application' and 'click' in c.fw,
+         "Click-based CLI application with structured command interface"),
+        (lambda c: c.project_type == 'cli_application',
+         "Command-line application with entry points defined"),
+    ),
+    ((lambda c: c.project_type == 'cli_application' and 'plugin_architecture' in c.pat,
+      "Modular plugin architecture - excellent for extensibility and maintainability"),),
+    ((lambda c: c.project_type == 'cli_application' and 'template_system' in c.pat,
+      "Template-driven content generation system - professional development approach"),),
+    ((lambda c: c.project_type == 'cli_application' and 'hybrid_configuration' in c.pat,
+      "Hybrid configuration system with multi-layer environment support"),),
+    ((lambda c: c.project_type == 'cli_application' and 'cross_platform' in c.pat,
+      "Cross-platform installer system - Windows, macOS, and Linux support"),),
+    # Web application insights
+    (
+        (lambda c: c.project_type == 'web_application' and 'django' in c.fw,
+         "Django web application - follows MVT pattern"),
+        (lambda c: c.project_type == 'web_application' and 'fastapi' in c.fw,
+         "FastAPI application - modern async API framework"),
+        (lambda c: c.project_type == 'web_application' and 'nextjs' in c.fw,
+         "Next.js application - full-stack React framework"),
+        (lambda c: c.project_type == 'web_application' and 'react' in c.fw,
+         "React application - component-based frontend framework"),
+        (lambda c: c.project_type == 'web_application' and 'vue' in c.fw,
+         "Vue.js application - progressive frontend framework"),
+    ),
+    # Data science insights
+    (
+        (lambda c: c.project_type == 'data_science' and 'pandas' in c.fw and 'numpy' in c.fw,
+         "Data analysis project with pandas and numpy"),
+        (lambda c: c.project_type == 'data_science' and 'jupyter' in c.fw,
+         "Jupyter notebook-based data science project"),
+        (lambda c: c.project_type == 'data_science' and 'scikit-learn' in c.fw,
+         "Machine learning project with scikit-learn"),
+    ),
+    # Library insights
+    ((lambda c: c.project_type == 'library',
+      "Python library suitable for distribution"),),
+    ((lambda c: c.project_type == 'library' and 'documented' in c.pat,
+      "Well-documented library with comprehensive API reference"),),
+    ((lambda c: c.project_type == 'library' and 'has_tests' in c.pat,
+      "Tested library with good test coverage"),),
+    # Universal insights
+    ((lambda c: 'documentation_system' in c.pat,
+      "Comprehensive documentation system with multiple specialized guides"),),
+    # Next.js alongside a backend framework; the web insights above only
+    # name the backend in that case
+    ((lambda c: 'nextjs' in c.fw and not c.fw.isdisjoint(_NEXTJS_SHADOWING_FRAMEWORKS),
+      "Next.js application - full-stack React framework"),),
+    # Testing insights
+    (
+        (lambda c: 'has_tests' in c.pat,
+         lambda c: _TEST_COUNT_TMPL(c.test_count)),
+        (lambda c: True,
+         "No testing structure detected - consider adding tests"),
+    ),
+    # Architecture insights
+    ((lambda c: 'api_service' in c.pat,
+      "Service-oriented architecture with API layer"),),
+    ((lambda c: 'microservices' in c.pat,
+      "Microservices architecture - distributed system design"),),
+    ((lambda c: 'monorepo' in c.pat,
+      "Monorepo structure - multiple packages in single repository"),),
+)
+
+
+# Intern the literal insight texts so every emitted insight shares one object
+_INSIGHT_RULES = tuple(
+    tuple((predicate, sys.intern(message) if isinstance(message, str) else message)
+          for predicate, message in group)
+    for group in _INSIGHT_RULES
+)
+
+
+@lru_cache(maxsize=128)
+def _main_language(frameworks: FrozenSet[str], languages: Tuple[str, ...]) -> str:
+    """Determine the main programming language (memoized on its inputs)."""
+    # Check frameworks first for hints
+    if any(fw in frameworks for fw in ['django', 'fastapi', 'flask', 'pytest']):
+        return 'python'
+    elif any(fw in frameworks for fw in ['nextjs', 'react', 'vue', 'angular', 'express', 'jest']):
+        return 'javascript' if 'javascript' in languages else 'typescript'
+    
+    # Fall back to first language detected
+    return languages[0] if languages else 'unknown'
+
+
+@lru_cache(maxsize=128)
+def _stack_type(frameworks: FrozenSet[str], languages: Tuple[str, ...], patterns: FrozenSet[str]) -> str:
+    """Determine the type of technology stack (memoized on its inputs)."""
+    # CLI Framework detection
+    if 'cli_application' in patterns and 'plugin_architecture' in patterns:
+        return 'cli_development_framework'
+    elif 'cli_application' in patterns:
+        return 'cli_application'
+    
+    # Full-stack detection
+    has_backend = any(fw in frameworks for fw in ['django', 'fastapi', 'flask', 'express'])
+    has_frontend = any(fw in frameworks for fw in ['nextjs', 'react', 'vue', 'angular'])
+    
+    if has_backend and has_frontend:
+        return 'full_stack'
+    elif has_backend:
+        return 'backend'
+    elif has_frontend:
+        return 'frontend'
+    elif 'python' in languages:
+        return 'python_application'
+    elif 'javascript' in languages or 'typescript' in languages:
+        return 'javascript_application'
+    else:
+        return 'unknown'
 
 
 class DiscoverySynthesizer:
@@ -22,174 +236,106 @@ class DiscoverySynthesizer:
         Returns:
             Synthesis results
         """
+        ctx = self._build_context(analysis_data)
+        
         return {
-            'insights': self._generate_insights(analysis_data),
-            'recommendations': self._generate_recommendations(analysis_data),
-            'architecture_summary': self._summarize_architecture(analysis_data),
-            'quality_assessment': self._assess_quality(analysis_data),
-            'technology_stack': self._summarize_tech_stack(analysis_data)
+            'insights': list(self._generate_insights(ctx)),
+            'recommendations': list(self._generate_recommendations(ctx)),
+            'architecture_summary': self._summarize_architecture(ctx),
+            'quality_assessment': self._assess_quality(ctx),
+            'technology_stack': self._summarize_tech_stack(ctx)
         }
     
-    def _generate_insights(self, analysis_data: Dict[str, Any]) -> List[str]:
-        """Generate insights from analysis data."""
-        insights = []
-        
-        # Project size insights
-        total_files = analysis_data['structure']['total_files']
-        if total_files > 1000:
-            insights.append(f"Large codebase with {total_files} files - consider modularization")
-        elif total_files < 10:
-            insights.append("Small project - good for rapid development")
+    def synthesize_iter(self, analysis_data: Dict[str, Any], limit: Optional[int] = None) -> Dict[str, Iterator[str]]:
+        """Lazily generate insights and recommendations.
         
-        # Language diversity
-        languages = analysis_data['languages']
-        if len(languages) > 3:
-            insights.append(f"Multi-language project using {', '.join(languages)}")
-        elif 'python' in languages and 'javascript' in languages:
-            insights.append("Full-stack project with Python backend and JavaScript frontend")
+        Rules are only evaluated as the returned iterators are consumed, so
+        callers that display the first few entries skip the rest of the work.
         
-        # Framework insights
-        frameworks = analysis_data['frameworks']
-        patterns = analysis_data['patterns']
-        project_type = self._determine_project_type(analysis_data)
-        
-        # Context-aware insights based on project type
-        if project_type == 'cli_application':
-            if 'click' in frameworks and 'rich' in frameworks:
-                insights.append("Professional CLI development framework with Click and Rich console interface")
-            elif 'click' in frameworks:
-                insights.append("Click-based CLI application with structured command interface")
-            else:
-                insights.append("Command-line application with entry points defined")
-            
-            if 'plugin_architecture' in patterns:
-                insights.append("Modular plugin architecture - excellent for extensibility and maintainability")
-            
-            if 'template_system' in patterns:
-                insights.append("Template-driven content generation system - professional development approach")
-            
-            if 'hybrid_configuration' in patterns:
-                insights.append("Hybrid configuration system with multi-layer environment support")
-            
-            if 'cross_platform' in patterns:
-                insights.append("Cross-platform installer system - Windows, macOS, and Linux support")
-                
-        elif project_type == 'web_application':
-            if 'django' in frameworks:
-                insights.append("Django web application - follows MVT pattern")
-            elif 'fastapi' in frameworks:
-                insights.append("FastAPI application - modern async API framework")
-            elif 'nextjs' in frameworks:
-                insights.append("Next.js application - full-stack React framework")
-            elif 'react' in frameworks:
-                insights.append("React application - component-based frontend framework")
-            elif 'vue' in frameworks:
-                insights.append("Vue.js application - progressive frontend framework")
+        Args:
+            analysis_data: Raw analysis results
+            limit: Maximum number of entries per iterator (None for all)
             
-            if 'api_service' in patterns:
-                insights.append("Service-oriented architecture with API layer")
-                
-        elif project_type == 'data_science':
-            if 'pandas' in frameworks and 'numpy' in frameworks:
-                insights.append("Data analysis project with pandas and numpy")
-            elif 'jupyter' in frameworks:
-                insights.append("Jupyter notebook-based data science project")
-            elif 'scikit-learn' in frameworks:
-                insights.append("Machine learning project with scikit-learn")
-                
-        elif project_type == 'library':
-            insights.append("Python library suitable for distribution")
-            if 'documented' in patterns:
-                insights.append("Well-documented library with comprehensive API reference")
-            if 'has_tests' in patterns:
-                insights.append("Tested library with good test coverage")
-        
-        # Universal insights
-        if 'documentation_system' in patterns:
-            insights.append("Comprehensive documentation system with multiple specialized guides")
-        
-        # Additional framework insights (avoid duplicates)
-        if project_type != 'web_application' and 'django' in frameworks:
-            insights.append("Django web application - follows MVT pattern")
-        elif project_type != 'web_application' and 'fastapi' in frameworks:
-            insights.append("FastAPI application - modern async API framework")
-        elif 'nextjs' in frameworks:
-            insights.append("Next.js application - full-stack React framework")
-        
-        # Testing insights
-        patterns = analysis_data['patterns']
-        if 'has_tests' in patterns:
-            test_count = analysis_data['quality_metrics']['test_file_count']
-            insights.append(f"Well-tested project with {test_count} test files")
-        else:
-            insights.append("No testing structure detected - consider adding tests")
+        Returns:
+            Iterators over insights and recommendations
+        """
+        ctx = self._build_context(analysis_data)
         
-        # Architecture insights
-        if 'api_service' in patterns:
-            insights.append("Service-oriented architecture with API layer")
-        if 'microservices' in patterns:
-            insights.append("Microservices architecture - distributed system design")
-        if 'monorepo' in patterns:
-            insights.append("Monorepo structure - multiple packages in single repository")
+        return {
+            'insights': islice(self._generate_insights(ctx), limit),
+            'recommendations': islice(self._generate_recommendations(ctx), limit)
+        }
+    
+    def _build_context(self, analysis_data: Dict[str, Any]) -> _AnalysisContext:
+        """Convert analysis data into the shared lookup context."""
+        frameworks = frozenset(analysis_data['frameworks'])
+        patterns = frozenset(analysis_data['patterns'])
+        entry_points = analysis_data['entry_points']
+        quality_metrics = analysis_data['quality_metrics']
         
-        return insights
+        return _AnalysisContext(
+            data=analysis_data,
+            fw=frameworks,
+            pat=patterns,
+            langs=tuple(analysis_data['languages']),
+            entry_points=entry_points,
+            quality_metrics=quality_metrics,
+            python_deps=analysis_data['dependencies'].get('python', {}),
+            total_files=analysis_data['structure']['total_files'],
+            test_count=quality_metrics['test_file_count'],
+            project_type=self._determine_project_type(frameworks, patterns, entry_points)
+        )
+    
+    def _generate_insights(self, ctx: _AnalysisContext) -> Iterator[str]:
+        """Generate insights from analysis data."""
+        for group in _INSIGHT_RULES:
+            for predicate, message in group:
+                if predicate(ctx):
+                    yield message if isinstance(message, str) else message(ctx)
+                    break
     
-    def _generate_recommendations(self, analysis_data: Dict[str, Any]) -> List[str]:
+    def _generate_recommendations(self, ctx: _AnalysisContext) -> Iterator[str]:
         """Generate recommendations based on analysis."""
-        recommendations = []
+        patterns = ctx.pat
+        frameworks = ctx.fw
+        languages = ctx.langs
         
         # Testing recommendations
-        patterns = analysis_data['patterns']
         if 'has_tests' not in patterns:
-            frameworks = analysis_data['frameworks']
-            if 'python' in analysis_data['languages']:
+            if 'python' in languages:
                 if 'pytest' not in frameworks:
-                    recommendations.append("Add pytest for Python testing")
-            if 'javascript' in analysis_data['languages'] or 'typescript' in analysis_data['languages']:
+                    yield _REC_PYTEST
+            if 'javascript' in languages or 'typescript' in languages:
                 if 'jest' not in frameworks and 'vitest' not in frameworks:
-                    recommendations.append("Add Jest or Vitest for JavaScript testing")
+                    yield _REC_JS_TESTS
         
         # Documentation recommendations
         if 'documented' not in patterns:
-            recommendations.append("Add documentation directory and README files")
+            yield _REC_DOCUMENTATION
         
         # Containerization recommendations
-        if 'containerized' not in patterns:
-            if any(fw in analysis_data['frameworks'] for fw in ['django', 'fastapi', 'express', 'nextjs']):
-                recommendations.append("Consider adding Docker for containerization")
+        if frameworks and 'containerized' not in patterns:
+            if not _CONTAINER_CANDIDATE_FRAMEWORKS.isdisjoint(frameworks):
+                yield _REC_DOCKER
         
         # Quality recommendations
-        quality = analysis_data['quality_metrics']
-        if quality['total_lines_of_code'] > 10000 and quality['test_file_count'] == 0:
-            recommendations.append("Large codebase without tests - prioritize test coverage")
+        if ctx.quality_metrics['total_lines_of_code'] > 10000 and ctx.test_count == 0:
+            yield _REC_TEST_COVERAGE
         
         # Dependencies recommendations
-        python_deps = analysis_data['dependencies']['python']
-        if python_deps['requirements_txt'] and not python_deps['pyproject_toml']:
-            recommendations.append("Consider migrating to pyproject.toml for modern Python packaging")
-        
-        return recommendations
+        if 'python' in languages:
+            python_deps = ctx.python_deps
+            if python_deps.get('requirements_txt') and not python_deps.get('pyproject_toml'):
+                yield _REC_PYPROJECT
     
-    def _summarize_architecture(self, analysis_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _summarize_architecture(self, ctx: _AnalysisContext) -> Dict[str, Any]:
         """Summarize the project architecture."""
-        patterns = analysis_data['patterns']
-        frameworks = analysis_data['frameworks']
-        
-        architecture_type = "unknown"
-        if 'monorepo' in patterns:
-            architecture_type = "monorepo"
-        elif 'microservices' in patterns:
-            architecture_type = "microservices"
-        elif 'api_service' in patterns:
-            architecture_type = "api_service"
-        elif 'mvc' in patterns or 'mvc_like' in patterns:
-            architecture_type = "mvc"
-        else:
-            architecture_type = "standard"
+        patterns = ctx.pat
+        frameworks = ctx.fw
         
         # Determine application type with better classification
         app_type = "unknown"
-        project_type = self._determine_project_type(analysis_data)
+        project_type = ctx.project_type
         
         if project_type == 'cli_application':
             if 'plugin_architecture' in patterns:
@@ -207,12 +353,12 @@ class DiscoverySynthesizer:
             app_type = "data_analysis"
         elif project_type == 'mobile_application':
             app_type = "mobile_app"
-        elif analysis_data['entry_points']:
+        elif ctx.entry_points:
             app_type = "application"
         else:
             app_type = "library"
         
-        # Enhanced architecture type detection
+        # Architecture type detection
         if 'cli_application' in patterns and 'plugin_architecture' in patterns:
             architecture_type = "cli_development_framework"
         elif 'cli_application' in patterns:
@@ -230,92 +376,59 @@ class DiscoverySynthesizer:
         else:
             architecture_type = "standard"
         
+        pattern_list = ctx.data['patterns']
         return {
             'type': architecture_type,
             'application_type': app_type,
-            'patterns': patterns,
-            'complexity': 'high' if len(patterns) > 3 else 'medium' if len(patterns) > 1 else 'low'
+            'patterns': pattern_list,
+            'complexity': 'high' if len(pattern_list) > 3 else 'medium' if len(pattern_list) > 1 else 'low'
         }
     
-    def _assess_quality(self, analysis_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _assess_quality(self, ctx: _AnalysisContext) -> Dict[str, Any]:
         """Assess overall code quality with realistic, context-aware scoring."""
-        quality_metrics = analysis_data['quality_metrics']
-        patterns = analysis_data['patterns']
-        frameworks = analysis_data['frameworks']
+        quality_metrics = ctx.quality_metrics
+        patterns = ctx.pat
+        frameworks = ctx.fw
+        
+        # Shared lookups, evaluated once
+        has_tests = 'has_tests' in patterns
+        documented = 'documented' in patterns
+        containerized = 'containerized' in patterns
+        total_files = ctx.total_files
+        test_files = ctx.test_count
+        project_type = ctx.project_type
         
         # More conservative base score
         score = 40  # Lower base score for realism
         
         # Test coverage - more conservative
-        if 'has_tests' in patterns:
+        if has_tests:
             score += 15  # Reduced from 20
-            test_ratio = quality_metrics['test_file_count'] / max(1, analysis_data['structure']['total_files'])
+            test_ratio = test_files / max(1, total_files)
             if test_ratio > 0.1:  # More than 10% test files
                 score += 8  # Reduced from 10
         
         # Documentation - more conservative
-        if 'documented' in patterns:
+        if documented:
             score += 12  # Reduced from 15
         if 'documentation_system' in patterns:
             score += 8   # Reduced from 10
         
         # Context-aware bonuses based on project type
-        project_type = self._determine_project_type(analysis_data)
-        
-        if project_type == 'cli_application':
-            # CLI-specific bonuses
-            if 'cli_application' in patterns:
-                score += 10  # Reduced from 15
-            if 'rich_output' in patterns:
-                score += 5
-            if 'plugin_architecture' in patterns:
-                score += 8   # Reduced from 10
-            if 'template_system' in patterns:
-                score += 3   # Reduced from 5
-            if 'hybrid_configuration' in patterns:
-                score += 3   # Reduced from 5
-            if 'cross_platform' in patterns:
-                score += 3   # Reduced from 5
-                
-        elif project_type == 'web_application':
-            # Web-specific bonuses
-            if any(fw in frameworks for fw in ['django', 'flask', 'fastapi']):
-                score += 8
-            if any(fw in frameworks for fw in ['react', 'vue', 'angular']):
-                score += 8
-            if 'api_service' in patterns:
-                score += 5
-            if 'mvc' in patterns:
-                score += 5
-                
-        elif project_type == 'data_science':
-            # Data science bonuses
-            if any(fw in frameworks for fw in ['pandas', 'numpy', 'scikit-learn']):
-                score += 8
-            if 'jupyter' in frameworks:
-                score += 5
-            if 'notebooks' in patterns:
-                score += 3
-                
-        elif project_type == 'library':
-            # Library-specific bonuses
-            if 'documented' in patterns:
-                score += 5  # Extra bonus for documented libraries
-            if 'has_tests' in patterns:
-                score += 5  # Extra bonus for tested libraries
-            if 'versioned' in patterns:
-                score += 3
+        score += sum(points for pattern, points in _TYPE_PATTERN_BONUSES.get(project_type, ())
+                     if pattern in patterns)
+        score += sum(points for group, points in _TYPE_FRAMEWORK_BONUSES.get(project_type, ())
+                     if not group.isdisjoint(frameworks))
         
         # Universal quality indicators
-        if 'containerized' in patterns:
+        if containerized:
             score += 8  # Reduced from 10
         
         # Code organization
-        if any(pattern in patterns for pattern in ['mvc', 'api_service', 'microservices']):
+        if not _ORGANIZATION_PATTERNS.isdisjoint(patterns):
             score += 8  # Reduced from 10
         
         # Complexity penalties
-        total_files = analysis_data['structure']['total_files']
         if total_files > 1000:
             score -= 5  # Large projects are harder to maintain
         elif total_files < 5:
@@ -326,94 +439,52 @@ class DiscoverySynthesizer:
         
         return {
             'overall_score': score,
-            'has_tests': 'has_tests' in patterns,
-            'has_documentation': 'documented' in patterns,
-            'is_containerized': 'containerized' in patterns,
-            'test_file_count': quality_metrics['test_file_count'],
+            'has_tests': has_tests,
+            'has_documentation': documented,
+            'is_containerized': containerized,
+            'test_file_count': test_files,
             'lines_of_code': quality_metrics['total_lines_of_code'],
             'assessment': 'excellent' if score >= 80 else 'good' if score >= 60 else 'needs_improvement'
         }
     
-    def _determine_project_type(self, analysis_data: Dict[str, Any]) -> str:
+    def _determine_project_type(self, frameworks: FrozenSet[str], patterns: FrozenSet[str],
+                                entry_points: List[str]) -> str:
         """Determine the project type for context-aware scoring."""
-        frameworks = analysis_data['frameworks']
-        patterns = analysis_data['patterns']
-        entry_points = analysis_data['entry_points']
-        
         # Web applications
-        if any(fw in frameworks for fw in ['django', 'flask', 'fastapi', 'express', 'koa']):
-            return 'web_application'
-        if any(fw in frameworks for fw in ['react', 'vue', 'angular', 'nextjs', 'nuxt']):
+        if not _WEB_FRAMEWORKS.isdisjoint(frameworks):
             return 'web_application'
             
         # Data science projects
-        if any(fw in frameworks for fw in ['pandas', 'numpy', 'scikit-learn', 'tensorflow', 'pytorch']):
-            return 'data_science'
-        if 'jupyter' in frameworks or 'notebooks' in patterns:
+        if not _DATA_SCIENCE_FRAMEWORKS.isdisjoint(frameworks) or 'notebooks' in patterns:
             return 'data_science'
             
         # CLI applications
-        if any(fw in frameworks for fw in ['click', 'argparse', 'typer']) and entry_points:
+        if entry_points and not _CLI_FRAMEWORKS.isdisjoint(frameworks):
             return 'cli_application'
         if 'cli_application' in patterns:
             return 'cli_application'
             
         # Mobile applications
-        if any(fw in frameworks for fw in ['react-native', 'flutter', 'xamarin']):
+        if not _MOBILE_FRAMEWORKS.isdisjoint(frameworks):
             return 'mobile_application'
             
         # Default to library
         return 'library'
     
-    def _summarize_tech_stack(self, analysis_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _summarize_tech_stack(self, ctx: _AnalysisContext) -> Dict[str, Any]:
         """Summarize the technology stack."""
         return {
-            'languages': analysis_data['languages'],
-            'frameworks': analysis_data['frameworks'],
-            'main_language': self._determine_main_language(analysis_data),
-            'stack_type': self._determine_stack_type(analysis_data),
-            'entry_points': analysis_data['entry_points']
+            'languages': ctx.data['languages'],
+            'frameworks': ctx.data['frameworks'],
+            'main_language': self._determine_main_language(ctx),
+            'stack_type': self._determine_stack_type(ctx),
+            'entry_points': ctx.entry_points
         }
     
-    def _determine_main_language(self, analysis_data: Dict[str, Any]) -> str:
+    def _determine_main_language(self, ctx: _AnalysisContext) -> str:
         """Determine the main programming language."""
-        languages = analysis_data['languages']
-        frameworks = analysis_data['frameworks']
-        
-        # Check frameworks first for hints
-        if any(fw in frameworks for fw in ['django', 'fastapi', 'flask', 'pytest']):
-            return 'python'
-        elif any(fw in frameworks for fw in ['nextjs', 'react', 'vue', 'angular', 'express', 'jest']):
-            return 'javascript' if 'javascript' in languages else 'typescript'
-        
-        # Fall back to first language detected
-        return languages[0] if languages else 'unknown'
+        return _main_language(ctx.fw, ctx.langs)
     
-    def _determine_stack_type(self, analysis_data: Dict[str, Any]) -> str:
+    def _determine_stack_type(self, ctx: _AnalysisContext) -> str:
         """Determine the type of technology stack."""
-        frameworks = analysis_data['frameworks']
-        languages = analysis_data['languages']
-        patterns = analysis_data['patterns']
-        
-        # CLI Framework detection
-        if 'cli_application' in patterns and 'plugin_architecture' in patterns:
-            return 'cli_development_framework'
-        elif 'cli_application' in patterns:
-            return 'cli_application'
-        
-        # Full-stack detection
-        has_backend = any(fw in frameworks for fw in ['django', 'fastapi', 'flask', 'express'])
-        has_frontend = any(fw in frameworks for fw in ['nextjs', 'react', 'vue', 'angular'])
-        
-        if has_backend and has_frontend:
-            return 'full_stack'
-        elif has_backend:
-            return 'backend'
-        elif has_frontend:
-            return 'frontend'
-        elif 'python' in languages:
-            return 'python_application'
-        elif 'javascript' in languages or 'typescript' in languages:
-            return 'javascript_application'
-        else:
-            return 'unknown'
+        return _stack_type(ctx.fw, ctx.langs, ctx.pat)
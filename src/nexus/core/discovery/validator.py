@@ -2,7 +2,33 @@
 Discovery Validator - Validates discovery results for completeness and accuracy.
 """
 
-from typing import Dict, List, Any
+from typing import Any, Callable, Dict, List, Tuple
+
+
+# Top-level keys every analysis and synthesis result must provide, in the
+# order missing ones are reported; the sets make the complete case one test
+_REQUIRED_ANALYSIS_FIELDS = (
+    'structure', 'dependencies', 'languages', 'frameworks', 'patterns', 'quality_metrics', 'entry_points'
+)
+_REQUIRED_ANALYSIS_FIELD_SET = frozenset(_REQUIRED_ANALYSIS_FIELDS)
+_REQUIRED_SYNTHESIS_FIELDS = (
+    'insights', 'recommendations', 'architecture_summary', 'quality_assessment', 'technology_stack'
+)
+_REQUIRED_SYNTHESIS_FIELD_SET = frozenset(_REQUIRED_SYNTHESIS_FIELDS)
+
+# Completeness scoring rules: (predicate(analysis, synthesis), points)
+_COMPLETENESS_RULES: Tuple[Tuple[Callable[[Dict[str, Any], Dict[str, Any]], bool], int], ...] = (
+    # Analysis completeness (60 points max)
+    (lambda a, s: a.get('structure', {}).get('total_files', 0) > 0, 15),
+    (lambda a, s: bool(a.get('languages')), 15),
+    (lambda a, s: bool(a.get('frameworks')), 10),
+    (lambda a, s: bool(a.get('patterns')), 10),
+    (lambda a, s: a.get('quality_metrics', {}).get('total_lines_of_code', 0) > 0, 10),
+    # Synthesis completeness (40 points max)
+    (lambda a, s: bool(s.get('insights')), 15),
+    (lambda a, s: bool(s.get('recommendations')), 15),
+    (lambda a, s: s.get('quality_assessment', {}).get('overall_score') is not None, 10),
+)
 
 
 class DiscoveryValidator:
@@ -22,30 +48,22 @@ class DiscoveryValidator:
         Returns:
             Validation results
         """
-        validation = {
-            'is_valid': True,
-            'completeness_score': 0,
-            'warnings': [],
-            'errors': [],
-            'missing_data': [],
-            'analysis_validation': self._validate_analysis(analysis_data),
-            'synthesis_validation': self._validate_synthesis(synthesis_data)
-        }
-        
-        # Calculate completeness score
-        validation['completeness_score'] = self._calculate_completeness(analysis_data, synthesis_data)
+        analysis_validation = self._validate_analysis(analysis_data)
+        synthesis_validation = self._validate_synthesis(synthesis_data)
         
         # Collect all warnings and errors
-        validation['warnings'].extend(validation['analysis_validation'].get('warnings', []))
-        validation['warnings'].extend(validation['synthesis_validation'].get('warnings', []))
-        validation['errors'].extend(validation['analysis_validation'].get('errors', []))
-        validation['errors'].extend(validation['synthesis_validation'].get('errors', []))
-        
-        # Set overall validation status
-        if validation['errors']:
-            validation['is_valid'] = False
-        
-        return validation
+        warnings = analysis_validation['warnings'] + synthesis_validation['warnings']
+        errors = analysis_validation['errors'] + synthesis_validation['errors']
+        
+        return {
+            'is_valid': not errors,
+            'completeness_score': self._calculate_completeness(analysis_data, synthesis_data),
+            'warnings': warnings,
+            'errors': errors,
+            'missing_data': [],
+            'analysis_validation': analysis_validation,
+            'synthesis_validation': synthesis_validation
+        }
     
     def _validate_analysis(self, analysis_data: Dict[str, Any]) -> Dict[str, Any]:
         """Validate analysis data."""
@@ -55,10 +73,11 @@ class DiscoveryValidator:
         }
         
         # Check required fields
-        required_fields = ['structure', 'dependencies', 'languages', 'frameworks', 'patterns', 'quality_metrics', 'entry_points']
-        for field in required_fields:
-            if field not in analysis_data:
-                validation['errors'].append(f"Missing analysis field: {field}")
+        if not _REQUIRED_ANALYSIS_FIELD_SET <= analysis_data.keys():
+            validation['errors'].extend(
+                f"Missing analysis field: {field}"
+                for field in _REQUIRED_ANALYSIS_FIELDS if field not in analysis_data
+            )
         
         # Validate structure data
         structure = analysis_data.get('structure', {})
@@ -85,10 +104,11 @@ class DiscoveryValidator:
         }
         
         # Check required fields
-        required_fields = ['insights', 'recommendations', 'architecture_summary', 'quality_assessment', 'technology_stack']
-        for field in required_fields:
-            if field not in synthesis_data:
-                validation['errors'].append(f"Missing synthesis field: {field}")
+        if not _REQUIRED_SYNTHESIS_FIELD_SET <= synthesis_data.keys():
+            validation['errors'].extend(
+                f"Missing synthesis field: {field}"
+                for field in _REQUIRED_SYNTHESIS_FIELDS if field not in synthesis_data
+            )
         
         # Validate insights
         insights = synthesis_data.get('insights', [])
@@ -109,26 +129,6 @@ class DiscoveryValidator:
     
     def _calculate_completeness(self, analysis_data: Dict[str, Any], synthesis_data: Dict[str, Any]) -> int:
         """Calculate completeness score (0-100)."""
-        score = 0
-        
-        # Analysis completeness (60 points max)
-        if analysis_data.get('structure', {}).get('total_files', 0) > 0:
-            score += 15
-        if analysis_data.get('languages'):
-            score += 15
-        if analysis_data.get('frameworks'):
-            score += 10
-        if analysis_data.get('patterns'):
-            score += 10
-        if analysis_data.get('quality_metrics', {}).get('total_lines_of_code', 0) > 0:
-            score += 10
-        
-        # Synthesis completeness (40 points max)
-        if synthesis_data.get('insights'):
-            score += 15
-        if synthesis_data.get('recommendations'):
-            score += 15
-        if synthesis_data.get('quality_assessment', {}).get('overall_score') is not None:
-            score += 10
-        
+        score = sum(points for predicate, points in _COMPLETENESS_RULES
+                    if predicate(analysis_data, synthesis_data))
         return min(100, score)
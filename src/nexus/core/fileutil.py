@@ -0,0 +1,96 @@
+"""File helpers shared by the installer, generator and configuration modules."""
+
+import os
+import shutil
+import stat
+from pathlib import Path
+from typing import Optional, Union
+
+# Temporary files are opened in binary mode (no newline translation on Windows)
+_TMP_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+
+
+def write_atomic(path: Union[str, Path], content: Union[str, bytes]) -> None:
+    """Write a file in one write call, replacing it atomically.
+    
+    The content goes to a uniquely named temporary file next to the target,
+    which is removed again if anything fails. An existing file keeps its
+    mode; a new one gets the mode a plain open() would have given it.
+    
+    Args:
+        path: Destination file
+        content: File content; text is encoded as UTF-8
+    """
+    data = content.encode("utf-8") if isinstance(content, str) else content
+    path = os.fspath(path)
+    directory, name = os.path.split(path)
+    
+    while True:
+        tmp_path = os.path.join(directory, f".{name}.{os.urandom(6).hex()}.tmp")
+        try:
+            # The kernel applies the umask to 0o666, as it would for open()
+            fd = os.open(tmp_path, _TMP_FLAGS, 0o666)
+            break
+        except FileExistsError:
+            continue
+    
+    try:
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        try:
+            os.chmod(tmp_path, stat.S_IMODE(os.stat(path).st_mode))
+        except FileNotFoundError:
+            pass
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def fast_copyfile(src: Union[str, Path], dst: Union[str, Path],
+                  src_stat: Optional[os.stat_result] = None) -> None:
+    """Copy a file and its metadata like shutil.copy2, in the kernel where possible.
+    
+    shutil.copyfile already uses sendfile (Linux) and fcopyfile (macOS); on
+    Linux os.copy_file_range is tried first, which avoids the page cache round
+    trip and can share extents on copy-on-write file systems.
+    
+    Args:
+        src: Source file
+        dst: Destination file
+        src_stat: Stat of the source if the caller already has it; mode and
+            timestamps are then applied from it instead of through copystat
+    """
+    copy_range = getattr(os, "copy_file_range", None)
+    complete = False
+    if copy_range is not None:
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                in_fd, out_fd = fsrc.fileno(), fdst.fileno()
+                remaining = os.fstat(in_fd).st_size
+                while remaining > 0:
+                    copied = copy_range(in_fd, out_fd, remaining)
+                    if not copied:
+                        break
+                    remaining -= copied
+                complete = remaining <= 0
+        except OSError:
+            pass
+    if not complete:
+        # Unavailable, unsupported here (or across these file systems), or
+        # stopped short; copyfile truncates whatever was written and picks
+        # the best remaining method
+        shutil.copyfile(src, dst)
+    
+    if src_stat is None:
+        shutil.copystat(src, dst)
+    else:
+        os.utime(dst, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+        os.chmod(dst, stat.S_IMODE(src_stat.st_mode))
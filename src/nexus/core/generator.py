@@ -1,14 +1,161 @@
 """Document generation module."""
 
-import shutil
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Dict, Any
-from rich.console import Console
-from rich.progress import Progress, TaskID
+from typing import List, Optional, Dict, Any, Iterable, Iterator, Tuple
 from .templates import TemplateManager
 from .config import ConfigManager
+from .fileutil import fast_copyfile, write_atomic
+
+
+@lru_cache(maxsize=1)
+def _console():
+    """Create the rich console on first use."""
+    from rich.console import Console
+    return Console()
+
+
+# Static document content, built once at import time
+_SECTION_INDEX_TEMPLATE = """# {upper} Documents
+
+*Generated {section} documents will appear here*
+
+## Overview
+This directory contains {section} documentation for the project.
+
+## Files
+*No {section} documents yet*
+
+## Usage
+Use the `nexus generate-docs` command to create documentation in this directory.
+"""
+
+_README_TEMPLATE = """# {project_name} Documentation
+
+This directory contains generated documentation for the project.
+
+## Structure
+{structure}
+## Usage
+This documentation is automatically generated and should be kept up to date.
+
+## Commands
+- `nexus generate-docs` - Regenerate all documentation
+- `nexus serve-docs` - Start local documentation server
+- `nexus status` - Check documentation status
+"""
+
+_SECTION_DESCRIPTIONS = {
+    "prd": "Product Requirements Documents",
+    "arch": "Architecture Documentation",
+    "impl": "Implementation Details",
+    "int": "Integration Documentation",
+    "exec": "Execution Documentation",
+    "rules": "Business Rules",
+    "task": "Task Documentation",
+    "tests": "Test Documentation"
+}
+
+# Section-specific template context defaults
+_PRD_DEFAULTS = {
+    "goals": [
+        "Define clear product requirements",
+        "Establish success criteria",
+        "Guide development efforts"
+    ],
+    "requirements": [
+        {
+            "title": "Core Functionality",
+            "description": "Essential features and capabilities",
+            "criteria": [
+                "Feature works as specified",
+                "Performance meets requirements",
+                "User experience is intuitive"
+            ]
+        }
+    ],
+    "success_metrics": [
+        "User adoption rate",
+        "Feature completion rate",
+        "User satisfaction score"
+    ],
+    "start_date": "TBD",
+    "end_date": "TBD",
+    "stakeholders": [
+        {"role": "Product Manager", "name": "TBD"},
+        {"role": "Engineering Lead", "name": "TBD"},
+        {"role": "Design Lead", "name": "TBD"}
+    ]
+}
+
+_ARCH_DEFAULTS = {
+    "components": [
+        {
+            "name": "Core System",
+            "description": "Main application components",
+            "responsibilities": [
+                "Business logic processing",
+                "Data management",
+                "API handling"
+            ],
+            "interfaces": [
+                "REST API",
+                "Database interface",
+                "External service integration"
+            ]
+        }
+    ],
+    "data_flow_description": "Data flows through the system components as follows...",
+    "technology_stack": [
+        {"category": "Backend", "choices": ["Python", "FastAPI", "PostgreSQL"]},
+        {"category": "Frontend", "choices": ["React", "TypeScript", "Tailwind CSS"]},
+        {"category": "Infrastructure", "choices": ["Docker", "Kubernetes", "AWS"]}
+    ],
+    "deployment_description": "The system is deployed using containerization...",
+    "security_considerations": [
+        "Authentication and authorization",
+        "Data encryption",
+        "Input validation",
+        "Secure communication"
+    ]
+}
+
+_TASK_DEFAULTS = {
+    "prerequisites": [
+        "Required setup completed",
+        "Dependencies installed",
+        "Environment configured"
+    ],
+    "steps": [
+        {
+            "number": 1,
+            "title": "Initial Setup",
+            "description": "Set up the initial environment",
+            "commands": ["echo 'Setting up...'", "mkdir -p workspace"],
+            "expected_output": "Environment ready"
+        }
+    ],
+    "verification": [
+        "Check that all steps completed successfully",
+        "Verify expected outputs",
+        "Test functionality"
+    ],
+    "troubleshooting": [
+        {
+            "problem": "Common issue",
+            "solution": "Solution description"
+        }
+    ]
+}
+
+_SECTION_DEFAULTS = {
+    "prd": _PRD_DEFAULTS,
+    "arch": _ARCH_DEFAULTS,
+    "task": _TASK_DEFAULTS
+}
 
-console = Console()
 
 class DocumentGenerator:
     """Generate project documentation using templates and existing content."""
@@ -23,6 +170,7 @@ class DocumentGenerator:
         self.config_manager = ConfigManager(self.project_root)
         self.template_manager = TemplateManager(self.project_root)
         self.source_docs_dir = self.project_root / "generated-docs"
+        self._output_paths: Dict[Optional[Path], Path] = {}
     
     def generate(self, output_dir: Optional[Path] = None, format: str = "markdown", 
                  include: Optional[List[str]] = None, auto_reload: bool = False) -> None:
@@ -34,15 +182,12 @@ class DocumentGenerator:
             include: Include specific documentation sections
             auto_reload: Auto-reload on changes
         """
-        console.print("📚 Generating documentation...", style="blue")
+        _console().print("📚 Generating documentation...", style="blue")
         
         # Determine output directory
-        if output_dir:
-            output_path = Path(output_dir)
-        else:
-            output_path = self.config_manager.get_docs_directory()
-        
-        output_path.mkdir(parents=True, exist_ok=True)
+        output_path = self._resolve_output_path(output_dir)
+        if not output_path.is_dir():
+            output_path.mkdir(parents=True, exist_ok=True)
         
         # Determine which sections to include
         if include is None:
@@ -56,10 +201,28 @@ class DocumentGenerator:
         elif format == "pdf":
             self._generate_pdf_docs(output_path, include)
         else:
-            console.print(f"❌ Unsupported format: {format}", style="red")
+            _console().print(f"❌ Unsupported format: {format}", style="red")
             return
         
-        console.print(f"✅ Documentation generated in {output_path}", style="green")
+        _console().print(f"✅ Documentation generated in {output_path}", style="green")
+    
+    def _resolve_output_path(self, output_dir: Optional[Path]) -> Path:
+        """Resolve the output directory, reusing earlier results.
+        
+        Args:
+            output_dir: Output directory passed to generate()
+            
+        Returns:
+            Output directory path
+        """
+        output_path = self._output_paths.get(output_dir)
+        if output_path is None:
+            if output_dir:
+                output_path = Path(output_dir)
+            else:
+                output_path = self.config_manager.get_docs_directory()
+            self._output_paths[output_dir] = output_path
+        return output_path
     
     def _generate_markdown_docs(self, output_path: Path, include: List[str]) -> None:
         """Generate markdown documentation.
@@ -68,7 +231,7 @@ class DocumentGenerator:
             output_path: Output directory
             include: List of sections to include
         """
-        console.print("📝 Generating markdown documentation...", style="blue")
+        _console().print("📝 Generating markdown documentation...", style="blue")
         
         # Copy existing generated-docs if available
         if self.source_docs_dir.exists():
@@ -82,7 +245,7 @@ class DocumentGenerator:
         # Create main README
         self._create_main_readme(output_path)
         
-        console.print("✅ Markdown documentation generated", style="green")
+        _console().print("✅ Markdown documentation generated", style="green")
     
     def _copy_existing_docs(self, output_path: Path, include: List[str]) -> None:
         """Copy existing documentation from generated-docs.
@@ -91,7 +254,9 @@ class DocumentGenerator:
             output_path: Output directory
             include: List of sections to include
         """
-        with Progress() as progress:
+        from rich.progress import Progress
+        
+        with Progress() as progress, ThreadPoolExecutor(max_workers=self._max_parallel()) as pool:
             task = progress.add_task("Copying existing docs...", total=len(include))
             
             for section in include:
@@ -101,13 +266,19 @@ class DocumentGenerator:
                 if source_dir.exists():
                     target_dir.mkdir(parents=True, exist_ok=True)
                     
-                    # Copy all markdown files
-                    for md_file in source_dir.glob("*.md"):
-                        shutil.copy2(md_file, target_dir / md_file.name)
+                    # Copy all markdown files concurrently; copies release the GIL
+                    with os.scandir(source_dir) as entries:
+                        copies = [
+                            pool.submit(fast_copyfile, entry.path, target_dir / entry.name, entry.stat())
+                            for entry in entries
+                            if entry.name.endswith(".md") and entry.is_file()
+                        ]
+                    for copy in copies:
+                        copy.result()
                     
-                    console.print(f"📋 Copied {section} documentation", style="green")
+                    _console().print(f"📋 Copied {section} documentation", style="green")
                 else:
-                    console.print(f"⚠️  Source directory not found: {source_dir}", style="yellow")
+                    _console().print(f"⚠️  Source directory not found: {source_dir}", style="yellow")
                 
                 progress.update(task, advance=1)
     
@@ -124,20 +295,7 @@ class DocumentGenerator:
             
             # Create index file
             index_file = section_dir / "index.md"
-            index_content = f"""# {section.upper()} Documents
-
-*Generated {section} documents will appear here*
-
-## Overview
-This directory contains {section} documentation for the project.
-
-## Files
-*No {section} documents yet*
-
-## Usage
-Use the `nexus generate-docs` command to create documentation in this directory.
-"""
-            index_file.write_text(index_content)
+            write_atomic(index_file, _SECTION_INDEX_TEMPLATE.format(upper=section.upper(), section=section))
     
     def _generate_from_templates(self, output_path: Path, include: List[str]) -> None:
         """Generate documents from templates.
@@ -150,166 +308,103 @@ Use the `nexus generate-docs` command to create documentation in this directory.
         if not self.template_manager.templates_dir.exists():
             self.template_manager.install_default_templates()
         
-        # Generate documents for each section
-        for section in include:
-            self._generate_section_docs(output_path / section, section)
+        # Documents are written as they are rendered
+        self._write_documents(self._render_documents(output_path, include))
     
-    def _generate_section_docs(self, section_dir: Path, section: str) -> None:
-        """Generate documents for a specific section.
+    def _render_documents(self, output_path: Path, include: List[str]) -> Iterator[Tuple[Path, str]]:
+        """Render template documents for every included section.
         
         Args:
-            section_dir: Directory for the section
-            section: Section name
+            output_path: Output directory
+            include: List of sections to include
+            
+        Yields:
+            (document path, content) pairs to write
         """
-        # Get available templates for this section
-        templates = self.template_manager.list_templates(section)
-        
-        if not templates:
-            return
-        
-        # Generate documents from templates
-        for category, template_list in templates.items():
-            for template_name in template_list:
-                self._generate_document_from_template(
-                    section_dir, section, category, template_name
-                )
+        for section in include:
+            # Get available templates for this section
+            templates = self.template_manager.list_templates(section)
+            if not templates:
+                continue
+            
+            section_dir = output_path / section
+            section_context = self._create_section_context(section)
+            
+            for category, template_list in templates.items():
+                for template_name in template_list:
+                    context = self._create_template_context(section, template_name, section_context)
+                    content = self.template_manager.render_template(
+                        template_name, context, category
+                    )
+                    if content:
+                        yield section_dir / f"{template_name}.md", content
     
-    def _generate_document_from_template(self, section_dir: Path, section: str, 
-                                       category: str, template_name: str) -> None:
-        """Generate a document from a template.
+    def _write_documents(self, documents: Iterable[Tuple[Path, str]]) -> None:
+        """Write rendered documents concurrently so their syscalls overlap.
+        
+        Writes start as documents arrive from the stream. Templates with the
+        same name in different categories render to the same path; a repeated
+        path waits for its earlier write, so the last content wins as it
+        would with sequential writes.
         
         Args:
-            section_dir: Directory for the section
-            section: Section name
-            category: Template category
-            template_name: Template name
+            documents: (document path, content) pairs
         """
-        # Create context for template
-        context = self._create_template_context(section, template_name)
-        
-        # Render template
-        content = self.template_manager.render_template(
-            template_name, context, category
-        )
+        with ThreadPoolExecutor(max_workers=self._max_parallel()) as pool:
+            writes = {}
+            for doc_file, content in documents:
+                earlier = writes.get(doc_file)
+                if earlier is not None:
+                    earlier.result()
+                writes[doc_file] = pool.submit(write_atomic, doc_file, content)
+            for doc_file, write in writes.items():
+                write.result()
+                _console().print(f"📄 Generated {doc_file.parent.name}/{doc_file.name}", style="green")
+    
+    def _max_parallel(self) -> int:
+        """Get the number of worker threads to use for file I/O.
         
-        if content:
-            # Create document file
-            doc_file = section_dir / f"{template_name}.md"
-            doc_file.write_text(content)
-            console.print(f"📄 Generated {section}/{template_name}.md", style="green")
+        Returns:
+            Configured execution.max_parallel, defaulting to the CPU count
+        """
+        return self.config_manager.get("execution.max_parallel", os.cpu_count()) or 1
     
-    def _create_template_context(self, section: str, template_name: str) -> Dict[str, Any]:
-        """Create context for template rendering.
+    def _create_section_context(self, section: str) -> Dict[str, Any]:
+        """Create the template context shared by every document in a section.
         
         Args:
             section: Section name
-            template_name: Template name
             
         Returns:
-            Context dictionary
+            Context dictionary without template-specific fields
         """
-        # Base context
         context = {
-            "title": f"{template_name.title()} {section.upper()}",
             "description": f"Generated {section} document for {self.project_root.name}",
             "project_name": self.project_root.name,
-            "section": section,
-            "template_name": template_name
+            "section": section
         }
         
         # Add section-specific context
-        if section == "prd":
-            context.update({
-                "goals": [
-                    "Define clear product requirements",
-                    "Establish success criteria",
-                    "Guide development efforts"
-                ],
-                "requirements": [
-                    {
-                        "title": "Core Functionality",
-                        "description": "Essential features and capabilities",
-                        "criteria": [
-                            "Feature works as specified",
-                            "Performance meets requirements",
-                            "User experience is intuitive"
-                        ]
-                    }
-                ],
-                "success_metrics": [
-                    "User adoption rate",
-                    "Feature completion rate",
-                    "User satisfaction score"
-                ],
-                "start_date": "TBD",
-                "end_date": "TBD",
-                "stakeholders": [
-                    {"role": "Product Manager", "name": "TBD"},
-                    {"role": "Engineering Lead", "name": "TBD"},
-                    {"role": "Design Lead", "name": "TBD"}
-                ]
-            })
-        elif section == "arch":
-            context.update({
-                "components": [
-                    {
-                        "name": "Core System",
-                        "description": "Main application components",
-                        "responsibilities": [
-                            "Business logic processing",
-                            "Data management",
-                            "API handling"
-                        ],
-                        "interfaces": [
-                            "REST API",
-                            "Database interface",
-                            "External service integration"
-                        ]
-                    }
-                ],
-                "data_flow_description": "Data flows through the system components as follows...",
-                "technology_stack": [
-                    {"category": "Backend", "choices": ["Python", "FastAPI", "PostgreSQL"]},
-                    {"category": "Frontend", "choices": ["React", "TypeScript", "Tailwind CSS"]},
-                    {"category": "Infrastructure", "choices": ["Docker", "Kubernetes", "AWS"]}
-                ],
-                "deployment_description": "The system is deployed using containerization...",
-                "security_considerations": [
-                    "Authentication and authorization",
-                    "Data encryption",
-                    "Input validation",
-                    "Secure communication"
-                ]
-            })
-        elif section == "task":
-            context.update({
-                "description": f"Task description for {template_name}",
-                "prerequisites": [
-                    "Required setup completed",
-                    "Dependencies installed",
-                    "Environment configured"
-                ],
-                "steps": [
-                    {
-                        "number": 1,
-                        "title": "Initial Setup",
-                        "description": "Set up the initial environment",
-                        "commands": ["echo 'Setting up...'", "mkdir -p workspace"],
-                        "expected_output": "Environment ready"
-                    }
-                ],
-                "verification": [
-                    "Check that all steps completed successfully",
-                    "Verify expected outputs",
-                    "Test functionality"
-                ],
-                "troubleshooting": [
-                    {
-                        "problem": "Common issue",
-                        "solution": "Solution description"
-                    }
-                ]
-            })
+        context.update(_SECTION_DEFAULTS.get(section, ()))
+        return context
+    
+    def _create_template_context(self, section: str, template_name: str,
+                                 section_context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Create context for template rendering.
+        
+        Args:
+            section: Section name
+            template_name: Template name
+            section_context: Precomputed result of _create_section_context
+            
+        Returns:
+            Context dictionary
+        """
+        context = dict(section_context or self._create_section_context(section))
+        context["title"] = f"{template_name.title()} {section.upper()}"
+        context["template_name"] = template_name
+        if section == "task":
+            context["description"] = f"Task description for {template_name}"
         
         return context
     
@@ -319,30 +414,18 @@ Use the `nexus generate-docs` command to create documentation in this directory.
         Args:
             output_path: Output directory
         """
-        readme_content = f"""# {self.project_root.name} Documentation
-
-This directory contains generated documentation for the project.
-
-## Structure
-"""
-        
         # Add structure based on available sections
-        for section_dir in output_path.iterdir():
-            if section_dir.is_dir():
-                section_name = section_dir.name
-                readme_content += f"- `{section_name}/` - {self._get_section_description(section_name)}\n"
-        
-        readme_content += """
-## Usage
-This documentation is automatically generated and should be kept up to date.
-
-## Commands
-- `nexus generate-docs` - Regenerate all documentation
-- `nexus serve-docs` - Start local documentation server
-- `nexus status` - Check documentation status
-"""
+        with os.scandir(output_path) as entries:
+            structure = "".join(
+                f"- `{entry.name}/` - {self._get_section_description(entry.name)}\n"
+                for entry in entries if entry.is_dir()
+            )
+        
+        readme_content = _README_TEMPLATE.format(
+            project_name=self.project_root.name, structure=structure
+        )
         
-        (output_path / "README.md").write_text(readme_content)
+        write_atomic(output_path / "README.md", readme_content)
     
     def _get_section_description(self, section: str) -> str:
         """Get description for a documentation section.
@@ -353,17 +436,7 @@ This documentation is automatically generated and should be kept up to date.
         Returns:
             Section description
         """
-        descriptions = {
-            "prd": "Product Requirements Documents",
-            "arch": "Architecture Documentation",
-            "impl": "Implementation Details",
-            "int": "Integration Documentation",
-            "exec": "Execution Documentation",
-            "rules": "Business Rules",
-            "task": "Task Documentation",
-            "tests": "Test Documentation"
-        }
-        return descriptions.get(section, f"{section.upper()} Documentation")
+        return _SECTION_DESCRIPTIONS.get(section, f"{section.upper()} Documentation")
     
     def _generate_html_docs(self, output_path: Path, include: List[str]) -> None:
         """Generate HTML documentation.
@@ -372,8 +445,8 @@ This documentation is automatically generated and should be kept up to date.
             output_path: Output directory
             include: List of sections to include
         """
-        console.print("🌐 Generating HTML documentation...", style="blue")
-        console.print("💡 HTML generation not yet implemented", style="yellow")
+        _console().print("🌐 Generating HTML documentation...", style="blue")
+        _console().print("💡 HTML generation not yet implemented", style="yellow")
     
     def _generate_pdf_docs(self, output_path: Path, include: List[str]) -> None:
         """Generate PDF documentation.
@@ -382,5 +455,5 @@ This documentation is automatically generated and should be kept up to date.
             output_path: Output directory
             include: List of sections to include
         """
-        console.print("📄 Generating PDF documentation...", style="blue")
-        console.print("💡 PDF generation not yet implemented", style="yellow")
+        _console().print("📄 Generating PDF documentation...", style="blue")
+        _console().print("💡 PDF generation not yet implemented", style="yellow")
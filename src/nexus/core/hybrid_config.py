@@ -13,16 +13,106 @@ FIXES:
 """
 
 import os
+import sys
+import copy
 import json
-import yaml
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Union
-from dataclasses import dataclass, field
+from typing import Callable, Dict, Any, Optional, List, Mapping, Union
+from dataclasses import dataclass, field, fields
 from enum import Enum
 from functools import lru_cache
-from rich.console import Console
 
-console = Console()
+from nexus.core.fileutil import write_atomic
+
+
+@lru_cache(maxsize=1)
+def _console():
+    """Create the rich console on first use."""
+    from rich.console import Console
+    return Console()
+
+
+@lru_cache(maxsize=1)
+def _yaml():
+    """Import PyYAML on first use; most invocations never parse YAML."""
+    import yaml
+    return yaml
+
+
+@lru_cache(maxsize=1)
+def _yaml_loader():
+    """Return the libyaml-backed loader when PyYAML was built with it."""
+    yaml = _yaml()
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@lru_cache(maxsize=1)
+def _yaml_dumper():
+    """Return the libyaml-backed dumper when PyYAML was built with it."""
+    yaml = _yaml()
+    return getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+@lru_cache(maxsize=128)
+def _parse_config_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a YAML or JSON config file once per (path, mtime_ns, size).
+    
+    The result is shared between callers and must not be mutated.
+    
+    Args:
+        path: Path to the config file
+        mtime_ns: Modification time of the file, part of the cache key
+        size: Size of the file, part of the cache key
+        
+    Returns:
+        Parsed configuration
+    """
+    data = _read_config_bytes(path, size)
+    if Path(path).suffix.lower() in ['.yaml', '.yml']:
+        return _yaml().load(data, Loader=_yaml_loader()) or {}
+    return json.loads(data)
+
+
+def _read_config_bytes(path: str, size: int) -> bytes:
+    """Read a config file of known size with unbuffered reads.
+    
+    Asking for one byte more than the stat'ed size lets a single os.read
+    both return the file and detect end of file; the remaining reads only
+    happen if the file grew in between.
+    
+    Args:
+        path: Path to the config file
+        size: Size of the file when it was stat'ed
+        
+    Returns:
+        File contents
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        data = os.read(fd, size + 1)
+        if len(data) <= size:
+            return data
+        chunks = [data]
+        while True:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                return b"".join(chunks)
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+
+
+# Environment variables that override NexusConfig attributes
+_ENV_MAPPINGS = (
+    ("NEXUS_LOG_LEVEL", "log_level"),
+    ("NEXUS_DEBUG", "debug"),
+    ("NEXUS_OUTPUT_DIR", "docs_dir"),
+    ("NEXUS_MAX_PARALLEL", "max_parallel"),
+    ("NEXUS_TIMEOUT", "timeout"),
+    ("NEXUS_PORT", "default_port"),
+    ("NEXUS_HOST", "default_host"),
+)
+_FEATURE_ENV_PREFIX = "NEXUS_FEATURE_"
 
 
 class Environment(Enum):
@@ -33,7 +123,14 @@ class Environment(Enum):
     PRODUCTION = "production"
 
 
-@dataclass
+_ENV_BY_NAME = {env.value: env for env in Environment}
+
+
+# Slotted dataclasses need Python 3.10+; older versions keep a __dict__
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class NexusConfig:
     """Centralized configuration for Nexus with hybrid structure."""
     
@@ -113,6 +210,9 @@ class NexusConfig:
     # Current environment
     environment: Environment = Environment.DEVELOPMENT
     
+    # NEXUS_DEBUG as read from the environment (see refresh_env)
+    _debug_env: bool = field(default=False, init=False, repr=False, compare=False)
+    
     def __post_init__(self):
         """Post-initialization setup."""
         self._load_from_environment()
@@ -120,56 +220,42 @@ class NexusConfig:
     def _load_from_environment(self) -> None:
         """Load configuration from environment variables."""
         # Environment detection
-        env_name = os.getenv(self.env_env_var, "development").lower()
-        try:
-            self.environment = Environment(env_name)
-        except ValueError:
-            self.environment = Environment.DEVELOPMENT
-        
-        # Override with environment variables
-        env_mappings = {
-            "NEXUS_LOG_LEVEL": "log_level",
-            "NEXUS_DEBUG": "debug",
-            "NEXUS_OUTPUT_DIR": "docs_dir",
-            "NEXUS_MAX_PARALLEL": "max_parallel",
-            "NEXUS_TIMEOUT": "timeout",
-            "NEXUS_PORT": "default_port",
-            "NEXUS_HOST": "default_host",
-        }
+        env = os.environ
+        env_name = env.get(self.env_env_var, "development").lower()
+        self.environment = _ENV_BY_NAME.get(env_name, Environment.DEVELOPMENT)
         
-        for env_var, attr_name in env_mappings.items():
-            value = os.getenv(env_var)
-            if value and hasattr(self, attr_name):
-                self._convert_and_set(attr_name, value)
-        
-        # Load feature flags from environment
-        self._load_feature_flags_from_env()
+        self._debug_env = _coerce_bool(env.get(self.debug_env_var, "false"))
+        self._apply_env_overrides()
     
-    def _convert_and_set(self, attr_name: str, value: str) -> None:
-        """Convert environment variable value to correct type and set attribute."""
-        current_value = getattr(self, attr_name)
-        if isinstance(current_value, bool):
-            setattr(self, attr_name, value.lower() in ('true', '1', 'yes'))
-        elif isinstance(current_value, int):
-            try:
-                setattr(self, attr_name, int(value))
-            except ValueError:
-                pass
-        else:
-            setattr(self, attr_name, value)
+    def refresh_env(self) -> None:
+        """Re-read environment variables changed since the config was created."""
+        self._load_from_environment()
     
-    def _load_feature_flags_from_env(self) -> None:
-        """Load feature flags from environment variables."""
-        for key in self.features:
-            env_var = f"NEXUS_FEATURE_{key.upper()}"
-            value = os.getenv(env_var)
+    def _apply_env_overrides(self, env: Optional[Mapping[str, str]] = None) -> None:
+        """Apply NEXUS_* attribute overrides and feature flags from the environment.
+        
+        Args:
+            env: Environment variables to read; defaults to os.environ
+        """
+        if env is None:
+            env = os.environ
+        for env_var, attr_name, coerce in _ENV_OVERRIDES:
+            value = env.get(env_var)
+            if value:
+                try:
+                    setattr(self, attr_name, coerce(value))
+                except ValueError:
+                    pass
+        
+        features = self.features
+        for key in features:
+            value = env.get(f"{_FEATURE_ENV_PREFIX}{key.upper()}")
             if value:
-                self.features[key] = value.lower() in ('true', '1', 'yes')
+                features[key] = _coerce_bool(value)
     
     def is_debug(self) -> bool:
         """Check if debug mode is enabled."""
-        return (os.getenv(self.debug_env_var, "false").lower() in ('true', '1', 'yes') or 
-                self.features.get("debug_mode", False))
+        return self._debug_env or self.features.get("debug_mode", False)
     
     def is_development(self) -> bool:
         """Check if running in development environment."""
@@ -180,6 +266,139 @@ class NexusConfig:
         return self.environment == Environment.PRODUCTION
 
 
+def _coerce_bool(value: str) -> bool:
+    """Interpret an environment variable value as a boolean flag."""
+    return value.lower() in ('true', '1', 'yes')
+
+
+# Converters from environment variable strings to each NexusConfig field's type
+_COERCERS = {
+    f.name: _coerce_bool if f.type is bool else int if f.type is int else str
+    for f in fields(NexusConfig)
+}
+
+# (variable, attribute, converter) triples for the NexusConfig fields that
+# can be overridden from the environment
+_ENV_OVERRIDES = tuple(
+    (env_var, attr_name, _COERCERS[attr_name])
+    for env_var, attr_name in _ENV_MAPPINGS
+    if attr_name in _COERCERS
+)
+
+def _unflatten_dict(flat: Dict[str, Any]) -> Dict[str, Any]:
+    """Expand dotted keys back into nested dictionaries for serialization.
+    
+    Shallower keys are placed first; a key that would have to nest under a
+    non-dict value keeps its dotted form at the top level instead.
+    
+    Args:
+        flat: Dictionary keyed by dotted paths
+        
+    Returns:
+        Nested dictionary
+    """
+    nested: Dict[str, Any] = {}
+    for key in sorted(flat, key=lambda k: k.count('.')):
+        *parents, leaf = key.split('.')
+        target = nested
+        for part in parents:
+            target = target.setdefault(part, {})
+            if not isinstance(target, dict):
+                nested[key] = flat[key]
+                break
+        else:
+            if isinstance(target.get(leaf), dict):
+                nested[key] = flat[key]
+            else:
+                target[leaf] = flat[key]
+    return nested
+
+
+# Results of full configuration loads, keyed by project, custom config file
+# and NEXUS_* environment; each entry records the stat of every path the load
+# probed so it is only reused while those files are unchanged
+_MERGED_CONFIGS: Dict[tuple, tuple] = {}
+
+# Marker for keys that do not resolve in ConfigManager.get()
+_MISSING = object()
+
+# Config file sections whose keys map directly onto NexusConfig attributes
+_SECTION_MAP = {
+    'project': (('name', 'project_name'), ('version', 'project_version'),
+                ('description', 'project_description')),
+    'logging': (('level', 'log_level'), ('format', 'log_format'), ('file', 'log_file')),
+    'execution': (('max_parallel', 'max_parallel'), ('timeout', 'timeout'),
+                  ('retry_attempts', 'retry_attempts')),
+    'documentation': (('formats', 'doc_formats'), ('auto_generate', 'auto_generate_docs')),
+    'directories': (('docs', 'docs_dir'), ('cache', 'cache_dir'), ('logs', 'logs_dir')),
+}
+
+# README written to the configs directory by initialize_project
+_README_BYTES = b"""# Nexus Configuration System
+
+This directory contains the detailed configuration structure for Nexus.
+
+## Structure
+
+- **`environments/`** - Environment-specific configurations
+- **`templates/`** - Configuration templates
+- **`schemas/`** - Configuration validation schemas
+
+## Configuration Priority
+
+1. Main config (`../../config.yaml`)
+2. Environment config (`environments/{env}.json` as generated by `initialize_project`;
+   a hand-written `environments/{env}.yaml` is used when no `.json` file exists)
+3. Runtime config (`../../.nexus/config.json`)
+4. Environment variables (`NEXUS_*`)
+
+## Usage
+
+See the main project documentation for configuration usage examples.
+"""
+
+# Config keys validate_config requires, with their descriptions
+_REQUIRED_FIELDS = (
+    ("nexus.version", "Nexus version"),
+    ("nexus.docs_directory", "Documentation directory"),
+    ("project.name", "Project name"),
+)
+
+# (attribute, predicate flagging an invalid value, error) checks run by validate_config
+_VALUE_CHECKS = (
+    ("max_parallel", lambda value: value <= 0, "max_parallel must be greater than 0"),
+    ("timeout", lambda value: value <= 0, "timeout must be greater than 0"),
+    ("retry_attempts", lambda value: value < 0, "retry_attempts must be non-negative"),
+)
+
+_VALID_LOG_LEVELS = frozenset(("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"))
+
+# Document types and the NexusConfig attributes holding their directories
+_DOC_TYPE_DIRS = (
+    ("arch", "docs_arch_dir"),
+    ("impl", "docs_impl_dir"),
+    ("exec", "docs_exec_dir"),
+    ("int", "docs_int_dir"),
+    ("tests", "docs_tests_dir"),
+)
+
+# get_paths key → NexusConfig attribute resolved by _path
+_PATH_ATTRS = (
+    ("nexus", "nexus_dir"),
+    ("configs", "configs_dir"),
+    ("environments", "environments_dir"),
+    ("templates", "templates_dir"),
+    ("schemas", "schemas_dir"),
+    ("cache", "cache_dir"),
+    ("logs", "logs_dir"),
+    ("docs", "docs_dir"),
+)
+
+# Public NexusConfig fields exposed as flat config keys, in the sorted order
+# dir() used to produce
+_FLAT_FIELDS = tuple(sorted(f.name for f in fields(NexusConfig) if not f.name.startswith('_')))
+
+
 class ConfigManager:
     """
     Enhanced configuration manager for Nexus with hybrid structure.
@@ -206,16 +425,104 @@ class ConfigManager:
         self._config_data = NexusConfig()
         self._flat_config = {}  # Flattened config for backwards compatibility
         self._runtime_overrides = {}
+        self._get_cache: Dict[str, Any] = {}  # Resolved dot-notation lookups
+        self._paths: Dict[str, Path] = {}  # See _path
+        self._doc_dirs: Optional[Dict[str, Path]] = None  # See _doc_type_map
+        self._path_map: Optional[Dict[str, Path]] = None  # See get_paths
+        self._probed: Optional[Dict[str, Optional[tuple]]] = None  # See _exists
+        
+        # NEXUS_* variables, read once; the environment is re-read on reload_config
+        self._env_overrides: Dict[str, str] = {
+            name: value for name, value in os.environ.items() if name.startswith("NEXUS_")
+        }
         
-        # Load configuration with caching
-        self._load_configuration()
-        self._build_flat_config()
+        # Configuration files are loaded on first use (see _ensure_loaded)
+        self._loaded = False
     
     @property
     def config(self) -> NexusConfig:
         """Get current configuration object."""
+        self._ensure_loaded()
         return self._config_data
     
+    def _ensure_loaded(self) -> None:
+        """Load configuration files and build the flat config on first use.
+        
+        Paths that no config file can change (.nexus, config dirs, the main
+        and runtime config files) are available without loading.
+        """
+        if not self._loaded:
+            self._loaded = True
+            if not self._restore_merged_config():
+                self._probed = {}
+                self._load_configuration()
+                self._remember_merged_config()
+                self._probed = None
+            self._build_flat_config()
+            # Environment overrides may have moved directories after files loaded
+            self._paths.clear()
+            self._doc_dirs = None
+            self._path_map = None
+    
+    def _exists(self, path: Path) -> bool:
+        """Check whether a config path exists, recording its state while loading.
+        
+        Args:
+            path: Path probed by the load pipeline
+            
+        Returns:
+            True if the path exists
+        """
+        try:
+            st = os.stat(path)
+        except OSError:
+            st = None
+        if self._probed is not None:
+            self._probed[str(path)] = (st.st_mtime_ns, st.st_size) if st else None
+        return st is not None
+    
+    def _merged_config_key(self) -> tuple:
+        """Key for _MERGED_CONFIGS: everything besides files that shapes the result."""
+        env_vars = tuple(sorted(self._env_overrides.items()))
+        # Probed paths may be relative to the working directory, so it is part
+        # of the key through the absolute project root
+        return os.path.abspath(self.project_root), str(self.custom_config_file), env_vars
+    
+    def _remember_merged_config(self) -> None:
+        """Store the result of a full load together with the files it probed."""
+        _MERGED_CONFIGS[self._merged_config_key()] = (
+            self._probed,
+            copy.deepcopy(self._config_data),
+            copy.deepcopy(self._runtime_overrides),
+            list(self._loaded_files),
+        )
+    
+    def _restore_merged_config(self) -> bool:
+        """Reuse an earlier load in this process if none of its files changed.
+        
+        Returns:
+            True if the configuration was restored
+        """
+        key = self._merged_config_key()
+        cached = _MERGED_CONFIGS.get(key)
+        if cached is None:
+            return False
+        
+        probed, config_data, runtime_overrides, loaded_files = cached
+        for path, signature in probed.items():
+            try:
+                st = os.stat(path)
+                current = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                current = None
+            if current != signature:
+                return False
+        
+        self._config_data = copy.deepcopy(config_data)
+        self._runtime_overrides = copy.deepcopy(runtime_overrides)
+        self._loaded_files = list(loaded_files)
+        return True
+    
     # ============================================================================
     # EXISTING API METHODS (Full Compatibility)
     # ============================================================================
@@ -230,6 +537,8 @@ class ConfigManager:
         Returns:
             Configuration value
         """
+        self._ensure_loaded()
+        
         # Check runtime overrides first
         if key in self._runtime_overrides:
             return self._runtime_overrides[key]
@@ -238,19 +547,22 @@ class ConfigManager:
         if key in self._flat_config:
             return self._flat_config[key]
         
-        # Navigate through dot notation
-        keys = key.split('.')
-        current = self._config_data
-        
-        for k in keys:
-            if hasattr(current, k):
-                current = getattr(current, k)
-            elif isinstance(current, dict) and k in current:
-                current = current[k]
-            else:
-                return default
+        # Navigate through dot notation, remembering the outcome
+        try:
+            current = self._get_cache[key]
+        except KeyError:
+            current = self._config_data
+            for k in key.split('.'):
+                if hasattr(current, k):
+                    current = getattr(current, k)
+                elif isinstance(current, dict) and k in current:
+                    current = current[k]
+                else:
+                    current = self._runtime_subtree(key)
+                    break
+            self._get_cache[key] = current
         
-        return current
+        return default if current is _MISSING else current
     
     def set(self, key: str, value: Any) -> None:
         """Set configuration value (runtime override).
@@ -259,24 +571,28 @@ class ConfigManager:
             key: Configuration key
             value: Value to set
         """
+        self._ensure_loaded()
+        
         self._runtime_overrides[key] = value
         
         # Update flat config cache
         self._flat_config[key] = value
+        self._get_cache.clear()
     
     def load_config(self) -> Dict[str, Any]:
         """Load configuration from file.
         
         Returns:
-            Configuration dictionary
+            Configuration dictionary; runtime overrides take precedence over
+            the flat config
         """
+        self._ensure_loaded()
+        
         if not self._flat_config:
             self._build_flat_config()
         
-        # Merge with runtime overrides
-        result = self._flat_config.copy()
-        result.update(self._runtime_overrides)
-        return result
+        # Merge with runtime overrides in a single dict build
+        return {**self._flat_config, **self._runtime_overrides}
     
     def save_config(self, config: Optional[Dict[str, Any]] = None) -> None:
         """Save configuration to file.
@@ -284,8 +600,11 @@ class ConfigManager:
         Args:
             config: Configuration to save (uses current config if None)
         """
+        self._ensure_loaded()
+        
         if config is not None:
-            self._runtime_overrides.update(config)
+            self._runtime_overrides.update(self._flatten_dict(config))
+            self._get_cache.clear()
         
         # Ensure nexus directory exists
         nexus_dir = self.get_nexus_dir()
@@ -295,9 +614,9 @@ class ConfigManager:
         runtime_config_path = self.get_runtime_config_path()
         try:
             with open(runtime_config_path, 'w') as f:
-                json.dump(self._runtime_overrides, f, indent=2)
+                json.dump(_unflatten_dict(self._runtime_overrides), f, indent=2)
         except IOError as e:
-            console.print(f"❌ Error saving config: {e}", style="red")
+            _console().print(f"❌ Error saving config: {e}", style="red")
     
     def update_config(self, updates: Dict[str, Any]) -> None:
         """Update configuration with new values.
@@ -305,16 +624,15 @@ class ConfigManager:
         Args:
             updates: Dictionary of updates to apply
         """
-        self._deep_update(self._runtime_overrides, updates)
+        self._ensure_loaded()
+        
+        # Overrides are stored flat, keyed by dotted path
+        flat_updates = self._flatten_dict(updates)
+        self._runtime_overrides.update(flat_updates)
+        self._get_cache.clear()
         
         # Update flat config cache
-        for key, value in updates.items():
-            if isinstance(value, dict):
-                # Handle nested updates
-                for nested_key, nested_value in self._flatten_dict(value, key).items():
-                    self._flat_config[nested_key] = nested_value
-            else:
-                self._flat_config[key] = value
+        self._flat_config.update(flat_updates)
     
     def is_initialized(self) -> bool:
         """Check if Nexus is initialized in this project.
@@ -340,7 +658,7 @@ class ConfigManager:
         Returns:
             Path to Cursor rules directory
         """
-        return self.project_root / ".cursor" / "rules"
+        return self._derived_path("cursor_rules", lambda: self.project_root / ".cursor" / "rules")
     
     def get_instructions_dir(self) -> Path:
         """Get instructions directory path.
@@ -348,7 +666,7 @@ class ConfigManager:
         Returns:
             Path to instructions directory
         """
-        return self.get_nexus_dir() / "instructions"
+        return self._derived_path("nexus_instructions", lambda: self.get_nexus_dir() / "instructions")
     
     def validate_config(self) -> List[str]:
         """Validate current configuration.
@@ -356,33 +674,25 @@ class ConfigManager:
         Returns:
             List of validation errors
         """
-        errors = []
+        self._ensure_loaded()
         
         # Check required fields
-        required_fields = [
-            ("nexus.version", "Nexus version"),
-            ("nexus.docs_directory", "Documentation directory"),
-            ("project.name", "Project name")
+        errors = [
+            f"Missing required field: {description} ({key})"
+            for key, description in _REQUIRED_FIELDS
+            if not self.get(key)
         ]
         
-        for field, description in required_fields:
-            if not self.get(field):
-                errors.append(f"Missing required field: {description} ({field})")
-        
         # Validate configuration object
-        if self._config_data.max_parallel <= 0:
-            errors.append("max_parallel must be greater than 0")
-        
-        if self._config_data.timeout <= 0:
-            errors.append("timeout must be greater than 0")
-        
-        if self._config_data.retry_attempts < 0:
-            errors.append("retry_attempts must be non-negative")
+        config = self._config_data
+        errors.extend(
+            message for attr, is_invalid, message in _VALUE_CHECKS
+            if is_invalid(getattr(config, attr))
+        )
         
         # Validate log level
-        valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        if self._config_data.log_level.upper() not in valid_levels:
-            errors.append(f"Invalid log level: {self._config_data.log_level}")
+        if config.log_level.upper() not in _VALID_LOG_LEVELS:
+            errors.append(f"Invalid log level: {config.log_level}")
         
         # Check if important directories exist (only if initialized)
         if self.is_initialized():
@@ -400,69 +710,132 @@ class ConfigManager:
     # NEW HYBRID CONFIGURATION METHODS
     # ============================================================================
     
+    def _path(self, attr: str) -> Path:
+        """Get the path for a NexusConfig directory/file attribute, built once.
+        
+        Args:
+            attr: Name of the NexusConfig attribute relative to the project root
+            
+        Returns:
+            Absolute path under the project root
+        """
+        try:
+            return self._paths[attr]
+        except KeyError:
+            # os.path.join on strings avoids pathlib's per-segment parsing;
+            # only the joined result is turned into a Path
+            joined = os.path.join(self.project_root, getattr(self._config_data, attr))
+            path = self._paths[attr] = Path(joined)
+            return path
+    
+    def _derived_path(self, key: str, build: Callable[[], Path]) -> Path:
+        """Get a path composed from other paths, built once like _path.
+        
+        Returning the same object also keeps Path's cached string form, so
+        callers converting it with str() or os.fspath() only pay for it once.
+        
+        Args:
+            key: Cache key; must not clash with a NexusConfig attribute name
+            build: Builds the path on a cache miss
+            
+        Returns:
+            The cached path
+        """
+        try:
+            return self._paths[key]
+        except KeyError:
+            path = self._paths[key] = build()
+            return path
+    
     def get_project_root(self) -> Path:
         """Get project root directory."""
         return self.project_root
     
     def get_nexus_dir(self) -> Path:
         """Get .nexus directory path."""
-        return self.project_root / self._config_data.nexus_dir
+        return self._path("nexus_dir")
     
     def get_configs_dir(self) -> Path:
         """Get detailed configurations directory."""
-        return self.project_root / self._config_data.configs_dir
+        return self._path("configs_dir")
     
     def get_environments_dir(self) -> Path:
         """Get environment configurations directory."""
-        return self.project_root / self._config_data.environments_dir
+        return self._path("environments_dir")
     
     def get_templates_dir(self) -> Path:
         """Get configuration templates directory."""
-        return self.project_root / self._config_data.templates_dir
+        return self._path("templates_dir")
     
     def get_schemas_dir(self) -> Path:
         """Get configuration schemas directory."""
-        return self.project_root / self._config_data.schemas_dir
+        return self._path("schemas_dir")
     
     def get_main_config_path(self) -> Path:
         """Get main configuration file path in project root."""
-        return self.project_root / self._config_data.main_config_file
+        return self._path("main_config_file")
     
     def get_environment_config_path(self, env: str = None) -> Path:
         """Get environment-specific config file path."""
-        env = env or self._config_data.environment.value
+        if not env:
+            self._ensure_loaded()
+            env = self._config_data.environment.value
         filename = self._config_data.env_config_pattern.format(env=env)
-        return self.get_environments_dir() / filename
+        path = self.get_environments_dir() / filename
+        
+        # Generated environment configs are stored as JSON, which parses far
+        # faster than YAML; prefer one when present
+        json_path = path.with_suffix('.json')
+        return json_path if self._exists(json_path) else path
     
     def get_runtime_config_path(self) -> Path:
         """Get runtime configuration file path."""
-        return self.project_root / self._config_data.runtime_config
+        return self._path("runtime_config")
     
     def get_cache_dir(self) -> Path:
         """Get cache directory path."""
-        return self.project_root / self._config_data.cache_dir
+        self._ensure_loaded()
+        return self._path("cache_dir")
     
     def get_logs_dir(self) -> Path:
         """Get logs directory path."""
-        return self.project_root / self._config_data.logs_dir
+        self._ensure_loaded()
+        return self._path("logs_dir")
     
     def get_log_file_path(self) -> Path:
         """Get log file path."""
-        return self.get_logs_dir() / self._config_data.log_file
+        logs_dir = self.get_logs_dir()
+        return self._derived_path("log_file_path", lambda: logs_dir / self._config_data.log_file)
     
     def get_docs_dir(self) -> Path:
         """Get documentation directory path."""
-        return self.project_root / self._config_data.docs_dir
+        self._ensure_loaded()
+        return self._path("docs_dir")
+    
+    def get_paths(self) -> Dict[str, Path]:
+        """Get the main project directories in one call.
+        
+        Returns:
+            Mapping of nexus, configs, environments, templates, schemas,
+            cache, logs and docs to their directory paths
+        """
+        if self._path_map is None:
+            self._ensure_loaded()
+            self._path_map = {key: self._path(attr) for key, attr in _PATH_ATTRS}
+        return dict(self._path_map)
     
     def get_doc_type_dirs(self) -> Dict[str, Path]:
         """Get all documentation type directories."""
-        return {
-            "arch": self.project_root / self._config_data.docs_arch_dir,
-            "impl": self.project_root / self._config_data.docs_impl_dir,
-            "exec": self.project_root / self._config_data.docs_exec_dir,
-            "int": self.project_root / self._config_data.docs_int_dir,
-            "tests": self.project_root / self._config_data.docs_tests_dir,
-        }
+        return dict(self._doc_type_map())
+    
+    def _doc_type_map(self) -> Dict[str, Path]:
+        """Get the doc type → directory mapping, built once per set of paths.
+        
+        The dict is shared between calls and must not be mutated.
+        """
+        if self._doc_dirs is None:
+            self._doc_dirs = {doc_type: self._path(attr) for doc_type, attr in _DOC_TYPE_DIRS}
+        return self._doc_dirs
     
     def ensure_directories(self) -> None:
         """Ensure all required directories exist."""
@@ -484,13 +857,29 @@ class ConfigManager:
         ]
         
         # Add documentation type directories
-        directories.extend(self.get_doc_type_dirs().values())
+        directories.extend(self._doc_type_map().values())
         
         for directory in directories:
             directory.mkdir(parents=True, exist_ok=True)
     
+    def _snapshot(self, directory: Path) -> Dict[str, os.DirEntry]:
+        """List a directory once so several existence checks share one scan.
+        
+        Args:
+            directory: Directory to list
+            
+        Returns:
+            Entries keyed by name; empty if the directory does not exist
+        """
+        try:
+            with os.scandir(directory) as entries:
+                return {entry.name: entry for entry in entries}
+        except OSError:
+            return {}
+    
     def get_loaded_files(self) -> List[str]:
         """Get list of loaded configuration files."""
+        self._ensure_loaded()
         return self._loaded_files.copy()
     
     def create_templates(self) -> None:
@@ -517,8 +906,9 @@ class ConfigManager:
         }
         
         template_path = templates_dir / "config.template.yaml"
-        with open(template_path, 'w') as f:
-            yaml.safe_dump(main_template, f, default_flow_style=False, indent=2)
+        template_path.write_text(
+            _yaml().dump(main_template, Dumper=_yaml_dumper(), default_flow_style=False, indent=2)
+        )
     
     def initialize_project(self) -> None:
         """Initialize project with required directories and files."""
@@ -530,18 +920,32 @@ class ConfigManager:
         if not main_config.exists():
             self.save_config_to_file(main_config, "main")
         
-        # Create environment configs if they don't exist
+        # Create environment configs if they don't exist: one listing of the
+        # environments directory answers the existence checks, and all
+        # configs are collected before being encoded and written
+        env_dir = self.get_environments_dir()
+        existing = self._snapshot(env_dir)
+        env_configs = {}
         for env in Environment:
-            env_config = self.get_environment_config_path(env.value)
-            if not env_config.exists():
-                env_data = {
+            env_config = env_dir / self._config_data.env_config_pattern.format(env=env.value)
+            json_config = env_config.with_suffix('.json')
+            if env_config.parent == env_dir:
+                present = env_config.name in existing or json_config.name in existing
+            else:
+                present = json_config.exists() or env_config.exists()
+            if not present:
+                env_configs[json_config] = {
                     "extends": "../../config.yaml",  # Reference main config
                     "environment": env.value,
                     "logging": {"level": "DEBUG" if env == Environment.DEVELOPMENT else "INFO"}
                 }
-                env_config.parent.mkdir(parents=True, exist_ok=True)
-                with open(env_config, 'w') as f:
-                    yaml.safe_dump(env_data, f, default_flow_style=False, indent=2)
+        
+        if env_configs:
+            encoder = json.JSONEncoder(indent=2)
+            for parent in {path.parent for path in env_configs}:
+                parent.mkdir(parents=True, exist_ok=True)
+            for env_config, env_data in env_configs.items():
+                env_config.write_text(encoder.encode(env_data))
         
         # Create templates
         self.create_templates()
@@ -560,6 +964,8 @@ class ConfigManager:
             config_path: Path to save config
             config_type: Type of config to save ("main", "runtime", "environment")
         """
+        self._ensure_loaded()
+        
         config_path.parent.mkdir(parents=True, exist_ok=True)
         
         try:
@@ -588,15 +994,15 @@ class ConfigManager:
                     "features": self._config_data.features
                 }
             else:
-                config_data = self._runtime_overrides
+                config_data = _unflatten_dict(self._runtime_overrides)
             
-            with open(config_path, 'w') as f:
-                if config_path.suffix.lower() in ['.yaml', '.yml']:
-                    yaml.safe_dump(config_data, f, default_flow_style=False, indent=2)
-                else:
-                    json.dump(config_data, f, indent=2)
+            if config_path.suffix.lower() in ['.yaml', '.yml']:
+                content = _yaml().dump(config_data, Dumper=_yaml_dumper(), default_flow_style=False, indent=2)
+            else:
+                content = json.dumps(config_data, indent=2)
+            config_path.write_text(content)
         except Exception as e:
-            console.print(f"Error saving config to {config_path}: {e}", style="red")
+            _console().print(f"Error saving config to {config_path}: {e}", style="red")
     
     # ============================================================================
     # INTERNAL METHODS (Performance Optimized)
@@ -607,42 +1013,42 @@ class ConfigManager:
         try:
             # 1. Load main config from project root
             main_config = self.get_main_config_path()
-            if main_config.exists():
+            if self._exists(main_config):
                 self._load_from_file(main_config)
             
             # 2. Load environment-specific config from docs/configs/environments/
             env_config = self.get_environment_config_path()
-            if env_config.exists():
+            if self._exists(env_config):
                 self._load_from_file(env_config)
             
             # 3. Load runtime config from .nexus/
             runtime_config = self.get_runtime_config_path()
-            if runtime_config.exists():
+            if self._exists(runtime_config):
                 self._load_runtime_config(runtime_config)
             
             # 4. Load custom config file if specified
             if self.custom_config_file:
                 custom_config_path = Path(self.custom_config_file)
-                if custom_config_path.exists():
+                if self._exists(custom_config_path):
                     self._load_from_file(custom_config_path)
             
             # 5. Load from environment variable
             env_config_path = os.getenv(self._config_data.config_env_var)
             if env_config_path:
                 env_path = Path(env_config_path)
-                if env_path.exists():
+                if self._exists(env_path):
                     self._load_from_file(env_path)
+            
+            # 6. Environment variable overrides take precedence over every file
+            if self._loaded_files:
+                self._config_data._apply_env_overrides(self._env_overrides)
         except Exception as e:
-            console.print(f"Warning: Error loading configuration: {e}", style="yellow")
+            _console().print(f"Warning: Error loading configuration: {e}", style="yellow")
     
     def _load_from_file(self, config_path: Path) -> None:
         """Load configuration from file."""
         try:
-            with open(config_path, 'r') as f:
-                if config_path.suffix.lower() in ['.yaml', '.yml']:
-                    data = yaml.safe_load(f) or {}
-                else:
-                    data = json.load(f)
+            data = self._parse_config_file(config_path)
             
             # Handle config inheritance
             if 'extends' in data:
@@ -654,85 +1060,76 @@ class ConfigManager:
             self._loaded_files.append(str(config_path))
             
         except Exception as e:
-            console.print(f"Warning: Failed to load config from {config_path}: {e}", style="yellow")
+            _console().print(f"Warning: Failed to load config from {config_path}: {e}", style="yellow")
+    
+    def _parse_config_file(self, config_path: Path, private: bool = True) -> Dict[str, Any]:
+        """Parse a YAML or JSON config file, reusing earlier parses of unchanged files.
+        
+        Args:
+            config_path: Path to the config file
+            private: Return a copy the caller may mutate; when False the
+                shared cached parse is returned and must be treated as read-only
+            
+        Returns:
+            The parsed configuration; empty files yield an empty dict
+            without being parsed
+        """
+        st = config_path.stat()
+        if not st.st_size:
+            # Placeholder overlays (e.g. an empty environment file) add nothing
+            return {}
+        data = _parse_config_cached(str(config_path), st.st_mtime_ns, st.st_size)
+        
+        # Callers mutate the result (e.g. dropping 'extends'), so hand out a copy
+        return copy.deepcopy(data) if private else data
     
     def _load_parent_config(self, parent_path: str, base_dir: Path) -> None:
         """Load parent configuration file (for config inheritance)."""
         parent_config_path = base_dir / parent_path
-        if parent_config_path.exists():
+        if self._exists(parent_config_path):
             self._load_from_file(parent_config_path)
     
     def _load_runtime_config(self, config_path: Path) -> None:
         """Load runtime configuration overrides."""
         try:
-            with open(config_path, 'r') as f:
-                self._runtime_overrides = json.load(f)
+            # Flattening already builds fresh containers for every nested
+            # level, so only list values need copying off the shared parse
+            flat = self._flatten_dict(self._parse_config_file(config_path, private=False))
+            self._runtime_overrides = {
+                key: copy.deepcopy(value) if isinstance(value, list) else value
+                for key, value in flat.items()
+            }
         except Exception as e:
-            console.print(f"Warning: Failed to load runtime config: {e}", style="yellow")
+            _console().print(f"Warning: Failed to load runtime config: {e}", style="yellow")
     
     def _update_config_from_dict(self, data: Dict[str, Any]) -> None:
         """Update configuration from dictionary with deep merge."""
-        # Handle nested project structure
-        if 'project' in data:
-            project_data = data['project']
-            if 'name' in project_data:
-                self._config_data.project_name = project_data['name']
-            if 'version' in project_data:
-                self._config_data.project_version = project_data['version']
-            if 'description' in project_data:
-                self._config_data.project_description = project_data['description']
+        self._get_cache.clear()
+        self._paths.clear()
+        self._doc_dirs = None
+        self._path_map = None
         
         # Handle environment
-        if 'environment' in data:
-            try:
-                self._config_data.environment = Environment(data['environment'])
-            except ValueError:
-                pass
-        
-        # Handle logging
-        if 'logging' in data:
-            logging_data = data['logging']
-            if 'level' in logging_data:
-                self._config_data.log_level = logging_data['level']
-            if 'format' in logging_data:
-                self._config_data.log_format = logging_data['format']
-            if 'file' in logging_data:
-                self._config_data.log_file = logging_data['file']
-        
-        # Handle execution
-        if 'execution' in data:
-            exec_data = data['execution']
-            if 'max_parallel' in exec_data:
-                self._config_data.max_parallel = exec_data['max_parallel']
-            if 'timeout' in exec_data:
-                self._config_data.timeout = exec_data['timeout']
-            if 'retry_attempts' in exec_data:
-                self._config_data.retry_attempts = exec_data['retry_attempts']
-        
-        # Handle documentation
-        if 'documentation' in data:
-            doc_data = data['documentation']
-            if 'formats' in doc_data:
-                self._config_data.doc_formats = doc_data['formats']
-            if 'auto_generate' in doc_data:
-                self._config_data.auto_generate_docs = doc_data['auto_generate']
+        environment = data.get('environment')
+        if isinstance(environment, str) and environment in _ENV_BY_NAME:
+            self._config_data.environment = _ENV_BY_NAME[environment]
+        
+        # Handle sections that map keys straight onto NexusConfig attributes
+        for section, mapping in _SECTION_MAP.items():
+            if section in data:
+                section_data = data[section]
+                for key, attr_name in mapping:
+                    if key in section_data:
+                        setattr(self._config_data, attr_name, section_data[key])
         
         # Handle features
         if 'features' in data and isinstance(data['features'], dict):
             self._config_data.features.update(data['features'])
-        
-        # Handle directories
-        if 'directories' in data:
-            dir_data = data['directories']
-            if 'docs' in dir_data:
-                self._config_data.docs_dir = dir_data['docs']
-            if 'cache' in dir_data:
-                self._config_data.cache_dir = dir_data['cache']
-            if 'logs' in dir_data:
-                self._config_data.logs_dir = dir_data['logs']
     
     def _build_flat_config(self) -> None:
         """Build flattened configuration for backwards compatibility."""
+        self._get_cache.clear()
+        
         # Start with nexus structure (for existing code compatibility)
         self._flat_config = {
             "nexus.version": self._config_data.project_version,
@@ -744,175 +1141,221 @@ class ConfigManager:
         }
         
         # Add all config object attributes as flat keys
-        for attr_name in dir(self._config_data):
-            if not attr_name.startswith('_') and not callable(getattr(self._config_data, attr_name)):
-                value = getattr(self._config_data, attr_name)
-                if isinstance(value, (str, int, float, bool, list)):
-                    self._flat_config[attr_name] = value
-                elif isinstance(value, Environment):
-                    self._flat_config[attr_name] = value.value
-                elif isinstance(value, dict):
-                    # Flatten nested dictionaries
-                    for nested_key, nested_value in self._flatten_dict(value, attr_name).items():
-                        self._flat_config[nested_key] = nested_value
+        for attr_name in _FLAT_FIELDS:
+            value = getattr(self._config_data, attr_name)
+            if isinstance(value, (str, int, float, bool, list)):
+                self._flat_config[attr_name] = value
+            elif isinstance(value, Environment):
+                self._flat_config[attr_name] = value.value
+            elif isinstance(value, dict):
+                # Flatten nested dictionaries
+                self._flat_config.update(self._flatten_dict(value, attr_name))
+    
+    def _runtime_subtree(self, key: str) -> Any:
+        """Rebuild the nested runtime overrides stored under a dotted prefix.
+        
+        Args:
+            key: Dotted key that is a parent of one or more overrides
+            
+        Returns:
+            Nested dictionary of the overrides, or _MISSING if there are none
+        """
+        prefix = f"{key}."
+        subtree = {
+            k[len(prefix):]: v for k, v in self._runtime_overrides.items()
+            if k.startswith(prefix)
+        }
+        return _unflatten_dict(subtree) if subtree else _MISSING
     
     def _flatten_dict(self, d: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
         """Flatten nested dictionary with dot notation."""
         flat = {}
-        for key, value in d.items():
-            full_key = f"{prefix}.{key}" if prefix else key
-            if isinstance(value, dict):
-                flat.update(self._flatten_dict(value, full_key))
-            else:
+        # Walk nested dicts with an explicit stack of (prefix, items) pairs,
+        # resuming each parent after its child so key order is preserved
+        stack = [(prefix, iter(d.items()))]
+        while stack:
+            prefix, items = stack[-1]
+            for key, value in items:
+                full_key = f"{prefix}.{key}" if prefix else key
+                if isinstance(value, dict):
+                    stack.append((full_key, iter(value.items())))
+                    break
                 flat[full_key] = value
-        return flat
-    
-    def _deep_update(self, base: Dict[str, Any], update: Dict[str, Any]) -> None:
-        """Deep merge configuration dictionaries."""
-        for key, value in update.items():
-            if key in base and isinstance(base[key], dict) and isinstance(value, dict):
-                self._deep_update(base[key], value)
             else:
-                base[key] = value
+                stack.pop()
+        return flat
     
     def _create_config_documentation(self) -> None:
-        """Create configuration documentation."""
-        configs_dir = self.get_configs_dir()
-        readme_path = configs_dir / "README.md"
+        """Create configuration documentation, leaving an up-to-date README untouched."""
+        readme_path = self.get_configs_dir() / "README.md"
         
-        readme_content = """# Nexus Configuration System
-
-This directory contains the detailed configuration structure for Nexus.
-
-## Structure
-
-- **`environments/`** - Environment-specific configurations
-- **`templates/`** - Configuration templates
-- **`schemas/`** - Configuration validation schemas
-
-## Configuration Priority
-
-1. Main config (`../../config.yaml`)
-2. Environment config (`environments/{env}.yaml`)
-3. Runtime config (`../../.nexus/config.json`)
-4. Environment variables (`NEXUS_*`)
-
-## Usage
-
-See the main project documentation for configuration usage examples.
-"""
+        try:
+            if readme_path.read_bytes() == _README_BYTES:
+                return
+        except OSError:
+            pass
         
-        with open(readme_path, 'w') as f:
-            f.write(readme_content)
+        # Replace the README atomically so readers never see a partial file
+        write_atomic(readme_path, _README_BYTES)
 
 
 # ============================================================================
 # GLOBAL CONFIGURATION INSTANCE & CONVENIENCE FUNCTIONS
 # ============================================================================
 
-_config_manager: Optional[ConfigManager] = None
+# Custom config file of the global manager, set by reload_config
+_config_file: Optional[Union[str, Path]] = None
+
+
+@lru_cache(maxsize=None)
+def _manager() -> ConfigManager:
+    """Create the global configuration manager on first use."""
+    return ConfigManager(config_file=_config_file)
 
 
 def get_config() -> NexusConfig:
     """Get the global configuration instance."""
-    global _config_manager
-    if _config_manager is None:
-        _config_manager = ConfigManager()
-    return _config_manager.config
+    return _manager().config
 
 
 def get_config_manager() -> ConfigManager:
     """Get the global configuration manager instance."""
-    global _config_manager
-    if _config_manager is None:
-        _config_manager = ConfigManager()
-    return _config_manager
+    return _manager()
 
 
 def reload_config(config_file: Optional[Union[str, Path]] = None) -> NexusConfig:
     """Reload configuration from files and environment."""
-    global _config_manager
-    _config_manager = ConfigManager(config_file=config_file)
-    return _config_manager.config
+    global _config_file
+    _config_file = config_file
+    _manager.cache_clear()
+    for helper in _CACHED_HELPERS:
+        helper.cache_clear()
+    return _manager().config
 
 
-# Convenience functions for common paths
+# Convenience functions for common paths; the global manager's directories
+# only change on reload_config, which clears these caches (_CACHED_HELPERS)
+@lru_cache(maxsize=None)
 def get_project_root() -> Path:
     """Get the project root directory."""
-    return get_config_manager().get_project_root()
+    return _manager().get_project_root()
 
 
+@lru_cache(maxsize=None)
 def get_docs_dir() -> Path:
     """Get the documentation directory."""
-    return get_config_manager().get_docs_dir()
+    return _manager().get_docs_dir()
 
 
+@lru_cache(maxsize=None)
 def get_cache_dir() -> Path:
     """Get the cache directory."""
-    return get_config_manager().get_cache_dir()
+    return _manager().get_cache_dir()
 
 
+@lru_cache(maxsize=None)
 def get_logs_dir() -> Path:
     """Get the logs directory."""
-    return get_config_manager().get_logs_dir()
+    return _manager().get_logs_dir()
 
 
+@lru_cache(maxsize=None)
 def get_configs_dir() -> Path:
     """Get the detailed configurations directory."""
-    return get_config_manager().get_configs_dir()
+    return _manager().get_configs_dir()
 
 
+@lru_cache(maxsize=None)
 def get_templates_dir() -> Path:
     """Get the configuration templates directory."""
-    return get_config_manager().get_templates_dir()
+    return _manager().get_templates_dir()
 
 
+@lru_cache(maxsize=None)
 def get_instructions_dir() -> Path:
     """Get the instructions directory."""
-    return get_config_manager().get_instructions_dir()
+    return _manager().get_instructions_dir()
 
 
+@lru_cache(maxsize=32)
 def get_doc_dir(doc_type: str) -> Path:
     """Get the directory for a specific document type."""
-    doc_dirs = get_config_manager().get_doc_type_dirs()
-    return doc_dirs.get(doc_type, get_docs_dir())
+    manager = _manager()
+    return manager._doc_type_map().get(doc_type) or manager.get_docs_dir()
 
 
-# Environment detection helpers
+# Environment detection helpers, resolved once per global manager
+@lru_cache(maxsize=None)
 def is_debug() -> bool:
     """Check if debug mode is enabled."""
-    return get_config().is_debug()
+    return _manager().config.is_debug()
 
 
+@lru_cache(maxsize=None)
 def is_development() -> bool:
     """Check if running in development environment."""
-    return get_config().is_development()
+    return _manager().config.is_development()
 
 
+@lru_cache(maxsize=None)
 def is_production() -> bool:
     """Check if running in production environment."""
-    return get_config().is_production()
+    return _manager().config.is_production()
 
 
+@lru_cache(maxsize=None)
 def get_environment() -> Environment:
     """Get current environment."""
-    return get_config().environment
+    return _manager().config.environment
+
+
+# Helpers whose results reload_config must discard
+_CACHED_HELPERS = (
+    get_project_root, get_docs_dir, get_cache_dir, get_logs_dir,
+    get_configs_dir, get_templates_dir, get_instructions_dir, get_doc_dir,
+    is_debug, is_development, is_production, get_environment,
+)
 
 
 # Configuration validation and initialization
 def validate_config() -> List[str]:
     """Validate current configuration and return errors."""
-    return get_config_manager().validate_config()
+    return _manager().validate_config()
 
 
 def initialize_project() -> None:
     """Initialize project with required directories and configuration."""
-    get_config_manager().initialize_project()
+    _manager().initialize_project()
+
+
+# Attribute-style access to the global configuration (PEP 562), e.g.
+# hybrid_config.docs_dir; resolved through the cached helpers on each access
+_LAZY_ATTRS = {
+    "config": get_config,
+    "environment": get_environment,
+    "project_root": get_project_root,
+    "docs_dir": get_docs_dir,
+    "cache_dir": get_cache_dir,
+    "logs_dir": get_logs_dir,
+    "configs_dir": get_configs_dir,
+    "templates_dir": get_templates_dir,
+    "instructions_dir": get_instructions_dir,
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the attributes in _LAZY_ATTRS from the global manager."""
+    try:
+        helper = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    return helper()
 
 
 if __name__ == "__main__":
-    # Test the fixed system
-    config_manager = ConfigManager()
+    # Test the fixed system; use the global manager so the get_* helpers
+    # below reuse it instead of loading the configuration a second time
+    config_manager = get_config_manager()
     
     print("=== Testing Backwards Compatibility ===")
     
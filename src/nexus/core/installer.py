@@ -5,15 +5,262 @@ import sys
 import json
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.prompt import Confirm, Prompt
-from rich.panel import Panel
-from rich.table import Table
+from string import Template
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from nexus.core.fileutil import fast_copyfile
+
+
+@lru_cache(maxsize=1)
+def _console():
+    """Create the rich console on first use; status checks never print."""
+    from rich.console import Console
+    return Console()
+
+
+# Root of the installed nexus package, whose docs/ and parent directory hold
+# the files to install; resolved once instead of per installer
+_nexus_package = sys.modules.get("nexus")
+if getattr(_nexus_package, "__file__", None):
+    _PACKAGE_ROOT = Path(_nexus_package.__file__).parent
+else:
+    _PACKAGE_ROOT = Path(__file__).parent.parent
+del _nexus_package
+
+# Initial auto-update settings; static, so serialized once
+_UPDATE_CONFIG_JSON = json.dumps({
+    "auto_check": True,
+    "check_interval": 86400,  # 24 hours
+    "last_check": None,
+    "update_channel": "stable"
+}, indent=2)
+
+# Status shown next to every item of the installation plan
+_PLAN_STATUS = "Will be created"
+
+# Index page created in each documentation type directory
+_DOC_INDEX_TEMPLATE = (
+    "# {upper} Documents\n"
+    "\n"
+    "*Generated {lower} documents will appear here*\n"
+    "\n"
+    "## Files\n"
+    "*No {lower} documents yet*\n"
+)
+
+# Index page of the discovery reports directory, stored encoded
+_DISCOVERY_INDEX_BYTES = """# Discovery Reports
+
+This directory contains Discovery System reports generated by Nexus.
+
+## Report Naming Convention
+
+Discovery reports follow the naming convention: `DISC-YYYY-MM-DD-Title.md`
+
+- **DISC**: Prefix indicating Discovery System report
+- **YYYY-MM-DD**: Date of analysis
+- **Title**: Descriptive title of the analysis
+
+## Available Reports
+
+*No discovery reports yet*
+
+## Usage
+
+Generate discovery reports using:
+
+```bash
+# Basic discovery with report saving
+nexus discover --save "Project Analysis"
+
+# Deep analysis with report saving
+nexus discover --deep --save "Deep Analysis Report"
+
+# List all reports
+nexus discovery list
+
+# View specific report
+nexus discovery view DISC-YYYY-MM-DD-Project-Analysis
+```
+
+## Report Formats
+
+Each discovery report includes:
+- **Markdown Summary**: Human-readable analysis summary
+- **JSON Data**: Detailed structured data for integration
+- **Context Data**: PRD-ready context information
+- **Metadata**: Analysis timestamp, options, and configuration
+""".encode()
+
+# Body of the panel shown after a successful install
+_SUCCESS_TEMPLATE = Template("""🎉 Nexus Installation Complete!
+
+Installation Directory: $nexus_dir
+Configuration Files: $config_dir
+Examples: $examples_dir
+
+Fixed Hybrid Configuration System:
+✅ Main config: $nexus_dir/config.yaml
+✅ Environment configs: $config_dir/environments/
+✅ Templates & schemas: $config_dir/templates/, $config_dir/schemas/
+✅ Runtime config: $nexus_dir/.nexus/config.json
+✅ Full API compatibility maintained
+
+Discovery System:
+🔍 Automatic code analysis and project understanding
+📊 Language and framework detection
+🏗️ Architectural pattern recognition
+💡 Intelligent insights and recommendations
+⚡ Caching system for performance
+📄 Report management (save, list, view reports)
+🎯 CLI integration (nexus discover, nexus discovery commands)
+
+Next Steps:
+1. Add $nexus_dir to your PATH
+2. Run 'nexus init-project' to create a new project
+3. Run 'nexus discover' to analyze your codebase
+4. Run 'nexus discover --save "Project Analysis"' to save reports
+5. Run 'nexus discovery list' to view saved reports
+6. Check 'nexus status' to verify installation
+7. Read the documentation in $nexus_dir/README.md
+8. Explore configuration examples in $config_dir/examples/
+
+Discovery Commands:
+• nexus discover [path] - Analyze project structure
+• nexus discover --deep - Detailed analysis
+• nexus discover --output json - JSON output
+• nexus discover --cache - Use cached results
+• nexus discover --save "Title" - Save discovery report
+• nexus discovery list - List saved reports
+• nexus discovery view REPORT_ID - View specific report
+
+Examples:
+• python $examples_dir/discovery_example.py - Run discovery examples
+• Check $examples_dir/ for more examples
+
+For help, run: nexus --help""")
+
+# Copy jobs are I/O bound and the kernel copies release the GIL
+_MAX_COPY_WORKERS = min(8, (os.cpu_count() or 1) * 2)
+
+
+def _copytree(src: Union[str, Path], dst: Union[str, Path]) -> None:
+    """Copy a directory tree like shutil.copytree(src, dst, dirs_exist_ok=True).
+    
+    Entry types come from the os.scandir listing and each file's stat is
+    reused for its metadata, so no entry is stat'ed more than once. Symlinks
+    are followed, as copytree does by default.
+    
+    Args:
+        src: Source directory
+        dst: Destination directory, created if missing
+    """
+    # Parents are created before their subdirectories are visited, so this
+    # is a single mkdir per directory rather than a makedirs walk
+    _ensure_dirs((dst,))
+    with os.scandir(src) as entries:
+        for entry in entries:
+            target = os.path.join(dst, entry.name)
+            if entry.is_dir():
+                _copytree(entry.path, target)
+            else:
+                fast_copyfile(entry.path, target, entry.stat())
+    shutil.copystat(src, dst)
+
+
+def _ensure_dirs(paths: Iterable[Union[str, Path]]) -> None:
+    """Create directories with one mkdir each, parents first.
+    
+    Sorting by length puts every requested ancestor before its descendants,
+    so a plain os.mkdir suffices instead of makedirs' per-component stat
+    walk; makedirs is only used when an unrequested parent is missing.
+    
+    Args:
+        paths: Directories that must exist afterwards
+    """
+    for path in sorted({os.fspath(p) for p in paths}, key=len):
+        try:
+            os.mkdir(path)
+        except FileExistsError:
+            if not os.path.isdir(path):
+                raise
+        except FileNotFoundError:
+            os.makedirs(path, exist_ok=True)
+
+
+def _run_copies(copies: List[Tuple[Callable[[Path, Path], None], Path, Path]]) -> None:
+    """Run independent copy jobs concurrently on a thread pool.
+    
+    Args:
+        copies: (copy function, source, destination) jobs with distinct destinations
+    """
+    if len(copies) <= 1:
+        for copy, src, dst in copies:
+            copy(src, dst)
+        return
+    
+    with ThreadPoolExecutor(max_workers=min(_MAX_COPY_WORKERS, len(copies))) as pool:
+        futures = [pool.submit(copy, src, dst) for copy, src, dst in copies]
+        for future in futures:
+            future.result()
+
+
+def _create_new_file(path: Union[str, Path], data: bytes) -> bool:
+    """Write a file only if it does not exist yet.
+    
+    O_EXCL makes the existence check part of the open, so an existing file
+    costs one failed syscall instead of a stat followed by a write.
+    
+    Args:
+        path: File to create
+        data: Content to write
+        
+    Returns:
+        True if the file was created, False if it already existed
+    """
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0), 0o666)
+    except FileExistsError:
+        return False
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+    return True
+
+
+@lru_cache(maxsize=1)
+def _default_install_dir() -> Path:
+    """Get the platform's default installation directory, resolved once."""
+    if sys.platform == "win32":
+        return Path.home() / "AppData" / "Local" / "Nexus"
+    elif sys.platform == "darwin":
+        return Path.home() / "Library" / "Application Support" / "Nexus"
+    else:
+        return Path.home() / ".local" / "nexus"
+
+
+def _is_installed_at(nexus_dir: Path) -> bool:
+    """Check if a Nexus installation exists in a directory.
+    
+    Args:
+        nexus_dir: The installation's nexus directory
+        
+    Returns:
+        True if its main config file exists
+    """
+    # The config file can only exist inside an existing nexus_dir, so one
+    # stat of it answers both checks
+    try:
+        os.stat(nexus_dir / "config.yaml")
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+    return True
 
-console = Console()
 
 class NexusInstaller:
     """Comprehensive installer for Nexus with hybrid configuration support."""
@@ -31,13 +278,22 @@ class NexusInstaller:
         self.config_dir = self.nexus_dir / "configs"
         self.templates_dir = self.nexus_dir / "templates"
         self.examples_dir = self.nexus_dir / "examples"
-        
-        # Get package root
-        import nexus
-        if hasattr(nexus, '__file__') and nexus.__file__:
-            self.package_root = Path(nexus.__file__).parent
-        else:
-            self.package_root = Path(__file__).parent.parent
+        self.package_root = _PACKAGE_ROOT
+        
+        # Paths the install steps use repeatedly, joined once
+        self._package_parent = self.package_root.parent
+        self._docs_configs = self.package_root / "docs" / "configs"
+        self._env_source = self._docs_configs / "environments"
+        self._templates_source = self._docs_configs / "templates"
+        self._schemas_source = self._docs_configs / "schemas"
+        self._examples_source = self._docs_configs / "examples"
+        self._readmes_source = self.package_root / "docs" / "readmes"
+        self._runtime_dir = self.nexus_dir / ".nexus"
+        self._docs_dir = self.nexus_dir / "nexus_docs"
+        self._config_subdirs = {
+            name: self.config_dir / name
+            for name in ("environments", "templates", "schemas", "examples")
+        }
     
     def install(self) -> bool:
         """Install Nexus with hybrid configuration system.
@@ -45,14 +301,17 @@ class NexusInstaller:
         Returns:
             True if installation successful, False otherwise
         """
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+        from rich.prompt import Confirm
+        
         try:
-            console.print("🚀 Installing Nexus with Hybrid Configuration System", style="bold blue")
-            console.print("=" * 60)
+            _console().print("🚀 Installing Nexus with Hybrid Configuration System", style="bold blue")
+            _console().print("=" * 60)
             
             # Check if already installed
             if not self.force and self._is_installed():
                 if not Confirm.ask("Nexus is already installed. Reinstall?"):
-                    console.print("Installation cancelled.", style="yellow")
+                    _console().print("Installation cancelled.", style="yellow")
                     return False
             
             # Create installation plan
@@ -60,14 +319,14 @@ class NexusInstaller:
             self._display_installation_plan(plan)
             
             if not Confirm.ask("Proceed with installation?"):
-                console.print("Installation cancelled.", style="yellow")
+                _console().print("Installation cancelled.", style="yellow")
                 return False
             
             # Execute installation
             with Progress(
                 SpinnerColumn(),
                 TextColumn("[progress.description]{task.description}"),
-                console=console,
+                console=_console(),
             ) as progress:
                 self._execute_installation(progress)
             
@@ -83,34 +342,31 @@ class NexusInstaller:
             return True
             
         except Exception as e:
-            console.print(f"❌ Installation failed: {e}", style="red")
+            _console().print(f"❌ Installation failed: {e}", style="red")
             return False
     
     def _get_default_install_dir(self) -> Path:
         """Get default installation directory."""
-        if sys.platform == "win32":
-            return Path.home() / "AppData" / "Local" / "Nexus"
-        elif sys.platform == "darwin":
-            return Path.home() / "Library" / "Application Support" / "Nexus"
-        else:
-            return Path.home() / ".local" / "nexus"
+        return _default_install_dir()
     
     def _is_installed(self) -> bool:
         """Check if Nexus is already installed."""
-        return self.nexus_dir.exists() and (self.nexus_dir / "config.yaml").exists()
+        return _is_installed_at(self.nexus_dir)
     
     def _create_installation_plan(self) -> Dict[str, List[str]]:
         """Create installation plan."""
+        # Display strings only, so join them as strings
+        config_dir = os.fspath(self.config_dir)
         return {
             "Directories": [
-                str(self.nexus_dir),
-                str(self.config_dir),
-                str(self.config_dir / "environments"),
-                str(self.config_dir / "templates"),
-                str(self.config_dir / "schemas"),
-                str(self.config_dir / "examples"),
-                str(self.templates_dir),
-                str(self.examples_dir),
+                os.fspath(self.nexus_dir),
+                config_dir,
+                os.path.join(config_dir, "environments"),
+                os.path.join(config_dir, "templates"),
+                os.path.join(config_dir, "schemas"),
+                os.path.join(config_dir, "examples"),
+                os.fspath(self.templates_dir),
+                os.fspath(self.examples_dir),
             ],
             "Configuration Files": [
                 "config.yaml (main configuration)",
@@ -154,17 +410,19 @@ class NexusInstaller:
     
     def _display_installation_plan(self, plan: Dict[str, List[str]]) -> None:
         """Display installation plan."""
-        console.print("\n📋 Installation Plan:", style="bold")
+        from rich.markup import escape
+        
+        _console().print("\n📋 Installation Plan:", style="bold")
         
+        # Every item has the same status, so render plain markup lines in a
+        # single print rather than building a Table per category
+        lines = []
         for category, items in plan.items():
-            table = Table(title=category)
-            table.add_column("Item", style="cyan")
-            table.add_column("Status", style="green")
-            
-            for item in items:
-                table.add_row(item, "Will be created")
-            
-            console.print(table)
+            lines.append(f"\n[bold]{escape(category)}[/bold]")
+            lines.extend(
+                f"  [cyan]{escape(item)}[/cyan]  [green]{_PLAN_STATUS}[/green]" for item in items
+            )
+        _console().print("\n".join(lines), highlight=False)
     
     def _execute_installation(self, progress) -> None:
         """Execute the installation process."""
@@ -173,20 +431,21 @@ class NexusInstaller:
         self._create_directories()
         progress.update(task1, completed=True)
         
-        # Install configuration files
-        task2 = progress.add_task("Installing configuration files...", total=None)
-        self._install_configuration_files()
-        progress.update(task2, completed=True)
-        
-        # Install documentation
-        task3 = progress.add_task("Installing documentation...", total=None)
-        self._install_documentation()
-        progress.update(task3, completed=True)
-        
-        # Install examples
-        task4 = progress.add_task("Installing examples...", total=None)
-        self._install_examples()
-        progress.update(task4, completed=True)
+        # Configuration files, documentation and examples go to disjoint
+        # subtrees of the directories created above, so install them concurrently
+        phases = [
+            ("Installing configuration files...", self._install_configuration_files),
+            ("Installing documentation...", self._install_documentation),
+            ("Installing examples...", self._install_examples),
+        ]
+        with ThreadPoolExecutor(max_workers=len(phases)) as pool:
+            running = [
+                (progress.add_task(description, total=None), pool.submit(phase))
+                for description, phase in phases
+            ]
+            for task, future in running:
+                future.result()
+                progress.update(task, completed=True)
         
         # Create runtime directories
         task5 = progress.add_task("Setting up runtime environment...", total=None)
@@ -195,164 +454,110 @@ class NexusInstaller:
     
     def _create_directories(self) -> None:
         """Create installation directories."""
-        directories = [
+        _ensure_dirs([
             self.nexus_dir,
             self.config_dir,
-            self.config_dir / "environments",
-            self.config_dir / "templates",
-            self.config_dir / "schemas",
-            self.config_dir / "examples",
+            *self._config_subdirs.values(),
             self.templates_dir,
             self.examples_dir,
-        ]
-        
-        for directory in directories:
-            directory.mkdir(parents=True, exist_ok=True)
+        ])
     
     def _install_configuration_files(self) -> None:
         """Install configuration files."""
+        # The files and trees below have distinct targets, so copy them concurrently
+        copies = []
+        
         # Main configuration
-        main_config = self.package_root.parent / "config.yaml"
+        main_config = self._package_parent / "config.yaml"
         if main_config.exists():
-            shutil.copy2(main_config, self.nexus_dir / "config.yaml")
+            copies.append((fast_copyfile, main_config, self.nexus_dir / "config.yaml"))
         
         # Environment configurations
-        env_source = self.package_root / "docs" / "configs" / "environments"
-        if env_source.exists():
-            env_target = self.config_dir / "environments"
-            shutil.copytree(env_source, env_target, dirs_exist_ok=True)
+        if self._env_source.exists():
+            copies.append((_copytree, self._env_source, self._config_subdirs["environments"]))
         
         # Templates
-        templates_source = self.package_root / "docs" / "configs" / "templates"
-        if templates_source.exists():
-            templates_target = self.config_dir / "templates"
-            shutil.copytree(templates_source, templates_target, dirs_exist_ok=True)
+        if self._templates_source.exists():
+            copies.append((_copytree, self._templates_source, self._config_subdirs["templates"]))
         
         # Schemas
-        schemas_source = self.package_root / "docs" / "configs" / "schemas"
-        if schemas_source.exists():
-            schemas_target = self.config_dir / "schemas"
-            shutil.copytree(schemas_source, schemas_target, dirs_exist_ok=True)
+        if self._schemas_source.exists():
+            copies.append((_copytree, self._schemas_source, self._config_subdirs["schemas"]))
         
         # Environment variables template
-        env_example = self.package_root.parent / ".env.example"
+        env_example = self._package_parent / ".env.example"
         if env_example.exists():
-            shutil.copy2(env_example, self.nexus_dir / ".env.example")
+            copies.append((fast_copyfile, env_example, self.nexus_dir / ".env.example"))
+        
+        _run_copies(copies)
     
     def _install_documentation(self) -> None:
         """Install documentation files."""
         # Ensure nexus_dir exists before copying files
         self.nexus_dir.mkdir(parents=True, exist_ok=True)
         
-        docs_source = self.package_root / "docs" / "readmes"
-        if docs_source.exists():
-            for doc_file in docs_source.glob("*.md"):
-                shutil.copy2(doc_file, self.nexus_dir / doc_file.name)
+        # Collect copies by target so the main README still wins over a
+        # packaged one, then run them concurrently
+        copies = {}
+        try:
+            # One directory read with a suffix test instead of glob's
+            # pattern matching; the stats it returns are reused by the copy
+            with os.scandir(self._readmes_source) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".md") and not entry.name.startswith(".") and entry.is_file():
+                        copies[entry.name] = (entry.path, entry.stat())
+        except FileNotFoundError:
+            pass
         
         # Main README
-        main_readme = self.package_root.parent / "README.md"
+        main_readme = self._package_parent / "README.md"
         if main_readme.exists():
-            shutil.copy2(main_readme, self.nexus_dir / "README.md")
+            copies["README.md"] = (main_readme, None)
+        
+        _run_copies([
+            (partial(fast_copyfile, src_stat=src_stat), src, self.nexus_dir / name)
+            for name, (src, src_stat) in copies.items()
+        ])
         
         # Create nexus_docs directory structure
         self._create_nexus_docs_structure()
     
     def _install_examples(self) -> None:
         """Install example files."""
-        examples_source = self.package_root / "docs" / "configs" / "examples"
-        if examples_source.exists():
-            shutil.copytree(examples_source, self.examples_dir, dirs_exist_ok=True)
+        if self._examples_source.exists():
+            _copytree(self._examples_source, self.examples_dir)
         
         # Install discovery example
         discovery_example_source = self.package_root / "docs" / "examples" / "discovery_example.py"
         if discovery_example_source.exists():
             discovery_example_target = self.examples_dir / "discovery_example.py"
-            shutil.copy2(discovery_example_source, discovery_example_target)
-            console.print("📁 Installed discovery example", style="green")
+            fast_copyfile(discovery_example_source, discovery_example_target)
+            _console().print("📁 Installed discovery example", style="green")
     
     def _create_nexus_docs_structure(self) -> None:
         """Create nexus_docs directory structure with discovery subdirectory."""
         # Use the target installation directory for docs
-        docs_dir = self.nexus_dir / "nexus_docs"
-        
-        # Create main docs directory
-        docs_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Create discovery subdirectory
+        docs_dir = self._docs_dir
         discovery_dir = docs_dir / "discovery"
-        discovery_dir.mkdir(parents=True, exist_ok=True)
+        doc_types = ["arch", "exec", "impl", "int", "prd", "rules", "task", "tests"]
+        
+        # Create the docs directory with its discovery and doc type subdirectories
+        _ensure_dirs([discovery_dir, *(docs_dir / doc_type for doc_type in doc_types)])
         
         # Create discovery index file
-        discovery_index = discovery_dir / "index.md"
-        if not discovery_index.exists():
-            discovery_index_content = """# Discovery Reports
-
-This directory contains Discovery System reports generated by Nexus.
-
-## Report Naming Convention
-
-Discovery reports follow the naming convention: `DISC-YYYY-MM-DD-Title.md`
-
-- **DISC**: Prefix indicating Discovery System report
-- **YYYY-MM-DD**: Date of analysis
-- **Title**: Descriptive title of the analysis
-
-## Available Reports
-
-*No discovery reports yet*
-
-## Usage
-
-Generate discovery reports using:
-
-```bash
-# Basic discovery with report saving
-nexus discover --save "Project Analysis"
-
-# Deep analysis with report saving
-nexus discover --deep --save "Deep Analysis Report"
-
-# List all reports
-nexus discovery list
-
-# View specific report
-nexus discovery view DISC-YYYY-MM-DD-Project-Analysis
-```
-
-## Report Formats
-
-Each discovery report includes:
-- **Markdown Summary**: Human-readable analysis summary
-- **JSON Data**: Detailed structured data for integration
-- **Context Data**: PRD-ready context information
-- **Metadata**: Analysis timestamp, options, and configuration
-"""
-            discovery_index.write_text(discovery_index_content)
-            console.print("📁 Created discovery reports directory", style="green")
+        if _create_new_file(discovery_dir / "index.md", _DISCOVERY_INDEX_BYTES):
+            _console().print("📁 Created discovery reports directory", style="green")
         
-        # Create standard documentation type directories
-        doc_types = ["arch", "exec", "impl", "int", "prd", "rules", "task", "tests"]
+        # Create index file for each standard documentation type
         for doc_type in doc_types:
-            doc_dir = docs_dir / doc_type
-            doc_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Create index file for each doc type
-            index_file = doc_dir / "index.md"
-            if not index_file.exists():
-                index_content = f"""# {doc_type.upper()} Documents
-
-*Generated {doc_type} documents will appear here*
-
-## Files
-*No {doc_type} documents yet*
-"""
-                index_file.write_text(index_content)
+            index_content = _DOC_INDEX_TEMPLATE.format(upper=doc_type.upper(), lower=doc_type)
+            _create_new_file(docs_dir / doc_type / "index.md", index_content.encode())
     
     def _setup_runtime_environment(self) -> None:
         """Set up runtime environment."""
-        # Create .nexus directory structure
-        nexus_runtime = self.nexus_dir / ".nexus"
-        nexus_runtime.mkdir(exist_ok=True)
+        # Create .nexus directory structure with cache, logs and instructions
+        nexus_runtime = self._runtime_dir
+        _ensure_dirs(nexus_runtime / name for name in ("cache", "logs", "instructions"))
         
         # Create initial runtime config using fixed configuration system
         from nexus.core.hybrid_config import get_config, Environment, ConfigManager
@@ -379,38 +584,32 @@ Each discovery report includes:
             "configuration": {
                 "hybrid_system": True,
                 "main_config": str(self.nexus_dir / "config.yaml"),
-                "configs_dir": str(self.nexus_dir / "configs"),
-                "templates_dir": str(self.nexus_dir / "configs" / "templates"),
-                "schemas_dir": str(self.nexus_dir / "configs" / "schemas"),
-                "examples_dir": str(self.nexus_dir / "configs" / "examples")
+                "configs_dir": str(self.config_dir),
+                "templates_dir": str(self._config_subdirs["templates"]),
+                "schemas_dir": str(self._config_subdirs["schemas"]),
+                "examples_dir": str(self._config_subdirs["examples"])
             }
         }
         
         config_file = nexus_runtime / "config.json"
-        with open(config_file, 'w') as f:
-            json.dump(runtime_config, f, indent=2)
-        
-        # Create cache and logs directories
-        (nexus_runtime / "cache").mkdir(exist_ok=True)
-        (nexus_runtime / "logs").mkdir(exist_ok=True)
-        (nexus_runtime / "instructions").mkdir(exist_ok=True)
+        config_file.write_text(json.dumps(runtime_config, indent=2))
         
         # Initialize the configuration system
         try:
             config_manager.initialize_project()
-            console.print("✅ Configuration system initialized", style="green")
+            _console().print("✅ Configuration system initialized", style="green")
             
             # Validate configuration
             errors = config_manager.validate_config()
             if errors:
-                console.print("⚠️ Configuration validation warnings:", style="yellow")
+                _console().print("⚠️ Configuration validation warnings:", style="yellow")
                 for error in errors:
-                    console.print(f"  - {error}", style="yellow")
+                    _console().print(f"  - {error}", style="yellow")
             else:
-                console.print("✅ Configuration validation passed", style="green")
+                _console().print("✅ Configuration validation passed", style="green")
                 
         except Exception as e:
-            console.print(f"⚠️ Warning: Could not initialize configuration system: {e}", style="yellow")
+            _console().print(f"⚠️ Warning: Could not initialize configuration system: {e}", style="yellow")
     
     def _post_installation_setup(self) -> None:
         """Post-installation setup tasks."""
@@ -429,14 +628,21 @@ Each discovery report includes:
         # For now, we'll create a simple wrapper script
         wrapper_script = self.nexus_dir / "nexus"
         
+        # Run the CLI entry point (nexus/__main__.py) with the interpreter
+        # doing the install, keeping the package importable from its source
+        # location; on POSIX exec replaces the shell instead of forking
         if sys.platform == "win32":
             wrapper_content = f"""@echo off
-python "{self.package_root.parent}" %*
+setlocal
+set "PYTHONPATH={self._package_parent};%PYTHONPATH%"
+"{sys.executable}" -m nexus %*
 """
             wrapper_script = self.nexus_dir / "nexus.bat"
         else:
-            wrapper_content = f"""#!/bin/bash
-python "{self.package_root.parent}" "$@"
+            wrapper_content = f"""#!/bin/sh
+PYTHONPATH="{self._package_parent}${{PYTHONPATH:+:$PYTHONPATH}}"
+export PYTHONPATH
+exec "{sys.executable}" -m nexus "$@"
 """
         
         with open(wrapper_script, 'w') as f:
@@ -454,78 +660,37 @@ python "{self.package_root.parent}" "$@"
     def _setup_auto_update(self) -> None:
         """Set up auto-update mechanism."""
         # Create update configuration
-        update_config = {
-            "auto_check": True,
-            "check_interval": 86400,  # 24 hours
-            "last_check": None,
-            "update_channel": "stable"
-        }
-        
-        update_file = self.nexus_dir / ".nexus" / "update_config.json"
-        with open(update_file, 'w') as f:
-            json.dump(update_config, f, indent=2)
+        update_file = self._runtime_dir / "update_config.json"
+        update_file.write_text(_UPDATE_CONFIG_JSON)
     
     def _display_success_message(self) -> None:
         """Display installation success message."""
+        from rich.panel import Panel
+        
         success_panel = Panel(
-            f"""🎉 Nexus Installation Complete!
-
-Installation Directory: {self.nexus_dir}
-Configuration Files: {self.config_dir}
-Examples: {self.examples_dir}
-
-Fixed Hybrid Configuration System:
-✅ Main config: {self.nexus_dir}/config.yaml
-✅ Environment configs: {self.config_dir}/environments/
-✅ Templates & schemas: {self.config_dir}/templates/, {self.config_dir}/schemas/
-✅ Runtime config: {self.nexus_dir}/.nexus/config.json
-✅ Full API compatibility maintained
-
-Discovery System:
-🔍 Automatic code analysis and project understanding
-📊 Language and framework detection
-🏗️ Architectural pattern recognition
-💡 Intelligent insights and recommendations
-⚡ Caching system for performance
-📄 Report management (save, list, view reports)
-🎯 CLI integration (nexus discover, nexus discovery commands)
-
-Next Steps:
-1. Add {self.nexus_dir} to your PATH
-2. Run 'nexus init-project' to create a new project
-3. Run 'nexus discover' to analyze your codebase
-4. Run 'nexus discover --save "Project Analysis"' to save reports
-5. Run 'nexus discovery list' to view saved reports
-6. Check 'nexus status' to verify installation
-7. Read the documentation in {self.nexus_dir}/README.md
-8. Explore configuration examples in {self.config_dir}/examples/
-
-Discovery Commands:
-• nexus discover [path] - Analyze project structure
-• nexus discover --deep - Detailed analysis
-• nexus discover --output json - JSON output
-• nexus discover --cache - Use cached results
-• nexus discover --save "Title" - Save discovery report
-• nexus discovery list - List saved reports
-• nexus discovery view REPORT_ID - View specific report
-
-Examples:
-• python {self.examples_dir}/discovery_example.py - Run discovery examples
-• Check {self.examples_dir}/ for more examples
-
-For help, run: nexus --help""",
+            _SUCCESS_TEMPLATE.substitute(
+                nexus_dir=self.nexus_dir,
+                config_dir=self.config_dir,
+                examples_dir=self.examples_dir,
+            ),
             title="Installation Successful",
             border_style="green"
         )
         
-        console.print(success_panel)
+        _console().print(success_panel)
     
     def _test_configuration_system(self) -> None:
-        """Test the configuration system after installation."""
+        """Test the configuration system after installation.
+        
+        Skipped when NEXUS_INSTALLER_SKIP_TEST is set (CI and repeat installs).
+        """
+        if os.environ.get("NEXUS_INSTALLER_SKIP_TEST"):
+            return
+        
         try:
             from nexus.core.hybrid_config import get_config, get_config_manager, is_debug, is_development
             
-            console.print("🧪 Testing configuration system...", style="blue")
+            _console().print("🧪 Testing configuration system...", style="blue")
             
             # Test configuration loading
             config = get_config()
@@ -538,51 +703,50 @@ For help, run: nexus --help""",
             dev_mode = is_development()
             
             # Test path helpers
-            docs_dir = config_manager.get_docs_dir()
-            cache_dir = config_manager.get_cache_dir()
-            configs_dir = config_manager.get_configs_dir()
+            paths = config_manager.get_paths()
+            docs_dir = paths["docs"]
+            cache_dir = paths["cache"]
             
             # Test backwards compatibility
             old_docs_dir = config_manager.get_docs_directory()
             is_init = config_manager.is_initialized()
             
-            console.print("✅ Configuration system test passed", style="green")
-            console.print(f"  Project: {project_name} ({environment})")
-            console.print(f"  Debug mode: {debug_mode}, Development: {dev_mode}")
-            console.print(f"  Directories: docs={docs_dir}, cache={cache_dir}")
-            console.print(f"  Backwards compatibility: {old_docs_dir == docs_dir}")
+            _console().print("✅ Configuration system test passed", style="green")
+            _console().print(f"  Project: {project_name} ({environment})")
+            _console().print(f"  Debug mode: {debug_mode}, Development: {dev_mode}")
+            _console().print(f"  Directories: docs={docs_dir}, cache={cache_dir}")
+            _console().print(f"  Backwards compatibility: {old_docs_dir == docs_dir}")
             
             # Test Discovery System
-            console.print("🔍 Testing Discovery System...", style="blue")
+            _console().print("🔍 Testing Discovery System...", style="blue")
             try:
                 from nexus.core.discovery.engine import DiscoveryEngine
                 from nexus.core.discovery.cache import DiscoveryCache
                 
                 # Test Discovery Engine initialization
                 engine = DiscoveryEngine(config_manager)
-                console.print("✅ Discovery Engine initialized successfully", style="green")
+                _console().print("✅ Discovery Engine initialized successfully", style="green")
                 
                 # Test Discovery Cache
                 cache = DiscoveryCache(cache_dir / "discovery")
-                console.print("✅ Discovery Cache initialized successfully", style="green")
+                _console().print("✅ Discovery Cache initialized successfully", style="green")
                 
-                console.print("✅ Discovery System test passed", style="green")
+                _console().print("✅ Discovery System test passed", style="green")
                 
             except Exception as e:
-                console.print(f"⚠️ Discovery System test failed: {e}", style="yellow")
+                _console().print(f"⚠️ Discovery System test failed: {e}", style="yellow")
             
         except Exception as e:
-            console.print(f"⚠️ Configuration system test failed: {e}", style="yellow")
+            _console().print(f"⚠️ Configuration system test failed: {e}", style="yellow")
     
     def _get_current_timestamp(self) -> str:
         """Get current timestamp as ISO string."""
-        from datetime import datetime
         return datetime.now().isoformat()
     
     def _generate_session_id(self) -> str:
         """Generate a unique session ID."""
-        import uuid
-        return str(uuid.uuid4())
+        # Opaque id: 128 random bits as hex, without building a UUID object
+        return os.urandom(16).hex()
 
 
 def install_nexus(target_dir: Optional[Path] = None, force: bool = False) -> bool:
@@ -609,23 +773,24 @@ def uninstall_nexus(install_dir: Optional[Path] = None) -> bool:
         True if uninstallation successful, False otherwise
     """
     if install_dir is None:
-        installer = NexusInstaller()
-        install_dir = installer.nexus_dir
+        install_dir = _default_install_dir() / "nexus"
     
     if not install_dir.exists():
-        console.print("Nexus is not installed.", style="yellow")
+        _console().print("Nexus is not installed.", style="yellow")
         return True
     
+    from rich.prompt import Confirm
+    
     if not Confirm.ask(f"Remove Nexus installation from {install_dir}?"):
-        console.print("Uninstallation cancelled.", style="yellow")
+        _console().print("Uninstallation cancelled.", style="yellow")
         return False
     
     try:
         shutil.rmtree(install_dir)
-        console.print("✅ Nexus uninstalled successfully.", style="green")
+        _console().print("✅ Nexus uninstalled successfully.", style="green")
         return True
     except Exception as e:
-        console.print(f"❌ Uninstallation failed: {e}", style="red")
+        _console().print(f"❌ Uninstallation failed: {e}", style="red")
         return False
 
 
@@ -635,12 +800,13 @@ def check_installation() -> Dict[str, any]:
     Returns:
         Dictionary with installation status information
     """
-    installer = NexusInstaller()
+    # Only the default paths are needed, so no installer is constructed
+    nexus_dir = _default_install_dir() / "nexus"
     
     status = {
-        "installed": installer._is_installed(),
-        "install_dir": str(installer.nexus_dir),
-        "config_dir": str(installer.config_dir),
+        "installed": _is_installed_at(nexus_dir),
+        "install_dir": str(nexus_dir),
+        "config_dir": str(nexus_dir / "configs"),
         "version": None,
         "last_updated": None
     }
@@ -648,12 +814,10 @@ def check_installation() -> Dict[str, any]:
     if status["installed"]:
         # Try to get version info
         try:
-            config_file = installer.nexus_dir / ".nexus" / "config.json"
-            if config_file.exists():
-                with open(config_file, 'r') as f:
-                    config = json.load(f)
-                    status["version"] = config.get("nexus", {}).get("version")
-                    status["last_updated"] = config.get("nexus", {}).get("install_date")
+            with open(nexus_dir / ".nexus" / "config.json", 'r') as f:
+                config = json.load(f)
+                status["version"] = config.get("nexus", {}).get("version")
+                status["last_updated"] = config.get("nexus", {}).get("install_date")
         except Exception:
             pass
     
@@ -673,7 +837,7 @@ if __name__ == "__main__":
     
     if args.check:
         status = check_installation()
-        console.print(json.dumps(status, indent=2))
+        _console().print(json.dumps(status, indent=2))
     elif args.uninstall:
         uninstall_nexus(args.target_dir)
     else:
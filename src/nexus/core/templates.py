@@ -1,12 +1,18 @@
 """Template management module."""
 
 import shutil
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional
-from jinja2 import Environment, FileSystemLoader, Template
-from rich.console import Console
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template
+
+
+@lru_cache(maxsize=1)
+def _console():
+    """Create the rich console on first use."""
+    from rich.console import Console
+    return Console()
 
-console = Console()
 
 class TemplateManager:
     """Manage templates for various document types."""
@@ -20,19 +26,52 @@ class TemplateManager:
         self.project_root = project_root or Path.cwd()
         self.nexus_dir = self.project_root / ".nexus"
         self.templates_dir = self.nexus_dir / "templates"
-        self.jinja_env = None
-        self._setup_jinja()
+        self.cache_dir = self.nexus_dir / "cache" / "jinja"
+        self._jinja_env: Optional[Environment] = None
+        self._fallback_env: Optional[Environment] = None  # Used until templates exist
+    
+    @property
+    def jinja_env(self) -> Environment:
+        """Jinja2 environment, built on first use and reused afterwards.
+        
+        Compiled templates are kept in memory for the lifetime of the manager
+        (re-checked against the file's mtime on each lookup, so edits on disk
+        are picked up) and persisted as bytecode under ``.nexus/cache/jinja``
+        so later runs skip parsing entirely.
+        """
+        if self._jinja_env is None:
+            if not self.templates_dir.exists():
+                # Fallback to string templates; kept apart from _jinja_env so
+                # templates installed later are still picked up
+                if self._fallback_env is None:
+                    self._fallback_env = Environment(loader=None)
+                return self._fallback_env
+            self._jinja_env = self._setup_jinja()
+        return self._jinja_env
     
-    def _setup_jinja(self):
+    def _setup_jinja(self) -> Environment:
         """Set up Jinja2 environment."""
-        if self.templates_dir.exists():
-            self.jinja_env = Environment(
-                loader=FileSystemLoader(str(self.templates_dir)),
-                autoescape=True
-            )
-        else:
-            # Fallback to string templates
-            self.jinja_env = Environment(loader=None)
+        # Persist bytecode only inside an existing .nexus directory, so that
+        # rendering never creates the project's runtime directory
+        bytecode_cache = None
+        if self.nexus_dir.is_dir():
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                bytecode_cache = FileSystemBytecodeCache(str(self.cache_dir))
+            except OSError:
+                pass
+        
+        return Environment(
+            loader=FileSystemLoader(str(self.templates_dir)),
+            autoescape=True,
+            auto_reload=True,
+            cache_size=-1,
+            bytecode_cache=bytecode_cache
+        )
+    
+    def _invalidate_templates(self) -> None:
+        """Drop compiled templates after the templates directory changes."""
+        self._jinja_env = None
     
     def create_template(self, template_name: str, content: str, category: str = "custom") -> None:
         """Create a new template.
@@ -47,8 +86,9 @@ class TemplateManager:
         
         template_file = category_dir / f"{template_name}.j2"
         template_file.write_text(content)
+        self._invalidate_templates()
         
-        console.print(f"📝 Created template: {category}/{template_name}", style="green")
+        _console().print(f"📝 Created template: {category}/{template_name}", style="green")
     
     def get_template(self, template_name: str, category: str = "default") -> Optional[Template]:
         """Get a template by name and category.
@@ -90,7 +130,7 @@ class TemplateManager:
         if template:
             return template.render(**context)
         else:
-            console.print(f"⚠️  Template not found: {category}/{template_name}", style="yellow")
+            _console().print(f"⚠️  Template not found: {category}/{template_name}", style="yellow")
             return ""
     
     def list_templates(self, category: Optional[str] = None) -> Dict[str, List[str]]:
@@ -416,8 +456,9 @@ class TemplateManager:
             for template_name, content in templates.items():
                 template_file = category_dir / f"{template_name}.j2"
                 template_file.write_text(content)
+        self._invalidate_templates()
         
-        console.print("📦 Installed default templates", style="green")
+        _console().print("📦 Installed default templates", style="green")
     
     def copy_existing_templates(self, source_dir: Path) -> None:
         """Copy existing templates from source directory.
@@ -426,7 +467,7 @@ class TemplateManager:
             source_dir: Source directory containing templates
         """
         if not source_dir.exists():
-            console.print(f"⚠️  Source directory not found: {source_dir}", style="yellow")
+            _console().print(f"⚠️  Source directory not found: {source_dir}", style="yellow")
             return
         
         # Copy all template files
@@ -435,5 +476,6 @@ class TemplateManager:
             target_file = self.templates_dir / relative_path.with_suffix('.j2')
             target_file.parent.mkdir(parents=True, exist_ok=True)
             shutil.copy2(template_file, target_file)
+        self._invalidate_templates()
         
-        console.print(f"📋 Copied templates from {source_dir}", style="green")
+        _console().print(f"📋 Copied templates from {source_dir}", style="green")
@@ -0,0 +1,30 @@
+"""Tests for the discovery synthesizer's insight generation."""
+
+import pytest
+
+from nexus.core.discovery.synthesizer import DiscoverySynthesizer
+
+
+def _analysis(frameworks, patterns):
+    """Build a minimal analysis result for synthesize()."""
+    return {
+        'structure': {'total_files': 50},
+        'dependencies': {'python': {}},
+        'languages': ['python'],
+        'frameworks': frameworks,
+        'patterns': patterns,
+        'quality_metrics': {'test_file_count': 4, 'total_lines_of_code': 500},
+        'entry_points': [],
+    }
+
+
+@pytest.mark.unit
+def test_web_api_service_insights_are_not_duplicated():
+    """A web app with an API layer gets each insight exactly once."""
+    synthesis = DiscoverySynthesizer().synthesize(_analysis(['django'], ['api_service', 'has_tests']))
+
+    assert synthesis['insights'] == [
+        "Django web application - follows MVT pattern",
+        "Well-tested project with 4 test files",
+        "Service-oriented architecture with API layer",
+    ]